@@ -0,0 +1,221 @@
+"""
+macOS fast paths for Mac Storage Analyzer.
+
+Wraps getattrlistbulk(2) via ctypes, which returns the name, type and size
+of many directory entries per syscall instead of one lstat per entry.
+Everything here degrades to "unavailable" (None) off macOS so callers can
+fall back to os.scandir.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from typing import Iterator, Optional
+
+# <sys/attr.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_TOTALSIZE = 0x00000002
+ATTR_FILE_ALLOCSIZE = 0x00000004
+
+# <sys/vnode.h> fsobj_type_t values
+VREG = 1
+VDIR = 2
+VLNK = 5
+
+_BUF_SIZE = 64 * 1024
+
+_U32 = struct.Struct("=I")
+_ATTRIBUTE_SET = struct.Struct("=5I")  # attribute_set_t
+_ATTRREFERENCE = struct.Struct("=iI")  # attrreference_t: data offset, length
+_OFF_T = struct.Struct("=q")
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_ATTRLIST = _AttrList(
+    bitmapcount=ATTR_BIT_MAP_COUNT,
+    commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_ERROR | ATTR_CMN_OBJTYPE,
+    fileattr=ATTR_FILE_TOTALSIZE | ATTR_FILE_ALLOCSIZE,
+)
+
+
+def _load_getattrlistbulk():
+    """Return the libc getattrlistbulk function, or None when unavailable."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        func = libc.getattrlistbulk
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_AttrList),
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint64,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_getattrlistbulk = _load_getattrlistbulk()
+
+
+class BulkEntry:
+    """
+    Minimal os.DirEntry stand-in filled from one getattrlistbulk record.
+
+    Type checks always use lstat semantics (symlinks are never followed).
+    size and alloc_size are in bytes and are 0 for non-files.
+    """
+
+    __slots__ = ("name", "path", "obj_type", "size", "alloc_size")
+
+    def __init__(self, name: str, path: str, obj_type: int, size: int, alloc_size: int):
+        self.name = name
+        self.path = path
+        self.obj_type = obj_type
+        self.size = size
+        self.alloc_size = alloc_size
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        return self.obj_type == VDIR
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        return self.obj_type == VREG
+
+    def is_symlink(self) -> bool:
+        return self.obj_type == VLNK
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=False)
+
+    def __repr__(self) -> str:
+        return f"<BulkEntry {self.name!r}>"
+
+
+def _parse_entries(buf, count: int, parent: str) -> Iterator[BulkEntry]:
+    """Decode count packed getattrlistbulk records from buf."""
+    view = memoryview(buf)
+    offset = 0
+    for _ in range(count):
+        (length,) = _U32.unpack_from(view, offset)
+        field = offset + _U32.size
+        offset += length
+
+        common, _vol, _dir, file_attrs, _fork = _ATTRIBUTE_SET.unpack_from(view, field)
+        field += _ATTRIBUTE_SET.size
+
+        # ATTR_CMN_ERROR is packed first, ahead of the other common attrs
+        error = 0
+        if common & ATTR_CMN_ERROR:
+            (error,) = _U32.unpack_from(view, field)
+            field += _U32.size
+
+        name = None
+        if common & ATTR_CMN_NAME:
+            data_offset, data_length = _ATTRREFERENCE.unpack_from(view, field)
+            start = field + data_offset
+            # data_length includes the trailing NUL
+            name = os.fsdecode(bytes(view[start : start + data_length - 1]))
+            field += _ATTRREFERENCE.size
+
+        obj_type = 0
+        if common & ATTR_CMN_OBJTYPE:
+            (obj_type,) = _U32.unpack_from(view, field)
+            field += _U32.size
+
+        size = alloc_size = 0
+        if file_attrs & ATTR_FILE_TOTALSIZE:
+            (size,) = _OFF_T.unpack_from(view, field)
+            field += _OFF_T.size
+        if file_attrs & ATTR_FILE_ALLOCSIZE:
+            (alloc_size,) = _OFF_T.unpack_from(view, field)
+            field += _OFF_T.size
+
+        if error or not name:
+            continue
+        yield BulkEntry(name, os.path.join(parent, name), obj_type, size, alloc_size)
+
+
+def list_dir(path: str) -> Optional[list[BulkEntry]]:
+    """
+    List path with getattrlistbulk.
+
+    Returns None when the syscall is unavailable or fails, so the caller
+    can fall back to os.scandir.
+    """
+    if _getattrlistbulk is None:
+        return None
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return None
+
+    try:
+        buf = ctypes.create_string_buffer(_BUF_SIZE)
+        entries = []
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(_ATTRLIST), buf, _BUF_SIZE, 0)
+            if count < 0:
+                return None
+            if count == 0:
+                return entries
+            entries.extend(_parse_entries(buf, count, path))
+    finally:
+        os.close(fd)
+
+
+def tree_alloc_kb(path: str) -> Optional[int]:
+    """
+    Return the allocated size of the tree at path in KB.
+
+    Sums ATTR_FILE_ALLOCSIZE over every non-directory entry, listing each
+    directory with getattrlistbulk and staying on path's filesystem.
+    Hard-linked files are counted once per link, like du -l. Returns None
+    when the syscall is unavailable or path itself cannot be listed, so the
+    caller can fall back to du.
+    """
+    if _getattrlistbulk is None:
+        return None
+    try:
+        root_dev = os.stat(path).st_dev
+    except OSError:
+        return None
+
+    total = 0
+    stack = [path]
+    while stack:
+        top = stack.pop()
+        entries = list_dir(top)
+        if entries is None:
+            if top == path:
+                return None
+            continue
+        for entry in entries:
+            if entry.obj_type != VDIR:
+                total += entry.alloc_size
+                continue
+            try:
+                if os.stat(entry.path, follow_symlinks=False).st_dev == root_dev:
+                    stack.append(entry.path)
+            except OSError:
+                continue
+    return (total + 1023) // 1024
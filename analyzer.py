@@ -7,6 +7,7 @@ Usage:
   python analyzer.py scan --path ~/Projects # Scan specific directory
   python analyzer.py scan --json            # Output JSON
   python analyzer.py report                 # Alias for scan
+  python analyzer.py scan --no-cache        # Ignore results cached by a recent scan
 """
 
 import argparse
@@ -15,6 +16,16 @@ import sys
 import os
 
 
+def _scan(base_path: str, args: argparse.Namespace) -> dict:
+    """Run a scan, reusing a recent cached result unless --no-cache was given."""
+    if args.no_cache:
+        from scanner import run_scan
+        return run_scan(base_path)
+
+    from scanner import run_scan_cached
+    return run_scan_cached(base_path)
+
+
 def cmd_scan(args: argparse.Namespace) -> None:
     """Run a full storage scan and display results."""
     base_path = os.path.expanduser(args.path)
@@ -25,57 +36,72 @@ def cmd_scan(args: argparse.Namespace) -> None:
 
     if not args.json:
         from rich.console import Console
-        from rich.spinner import Spinner
-        from rich.live import Live
-        import time
 
         console = Console()
         console.print(
             f"\n[cyan]Scanning [bold]{base_path}[/bold] — this may take a minute...[/cyan]\n"
         )
 
-    from scanner import run_scan
-    scan_results = run_scan(base_path)
+    scan_results = _scan(base_path, args)
 
     from recommender import generate_recommendations
-    recommendations = generate_recommendations(scan_results)
+    from scanner import summarize_categories
+
+    # One summary per report, shared by the recommender and the output
+    summaries = summarize_categories(scan_results)
+    recommendations = generate_recommendations(scan_results, summaries)
 
     if args.json:
+        from scanner import KB_TO_GB
+
         # Build JSON-serializable output
         output = {
             "scan_path": base_path,
             "disk": scan_results["disk"],
             "categories": {
                 "docker": {
-                    "available": scan_results["docker"].get("available", False),
-                    "total_gb": scan_results["docker"].get("total_kb", 0) / (1024 * 1024),
-                },
-                "node_modules": {
-                    "total_gb": scan_results["node_modules"]["total_kb"] / (1024 * 1024),
-                    "count": len(scan_results["node_modules"]["items"]),
+                    "available": summaries["docker"].available,
+                    "total_gb": summaries["docker"].total_kb * KB_TO_GB,
                 },
-                "python_venv": {
-                    "total_gb": scan_results["python_venv"]["total_kb"] / (1024 * 1024),
-                    "count": len(scan_results["python_venv"]["items"]),
+                **{
+                    key: {
+                        "total_gb": summaries[key].total_kb * KB_TO_GB,
+                        "count": len(summaries[key].items),
+                    }
+                    for key in ("node_modules", "python_venv", "ml_models")
                 },
-                "ml_models": {
-                    "total_gb": scan_results["ml_models"]["total_kb"] / (1024 * 1024),
-                    "count": len(scan_results["ml_models"]["items"]),
+                **{
+                    f"{key}_gb": summaries[key].total_kb * KB_TO_GB
+                    for key in (
+                        "caches",
+                        "xcode_dev",
+                        "logs",
+                        "trash",
+                        "downloads",
+                        "projects",
+                        "app_support",
+                    )
                 },
-                "caches_gb": scan_results["caches"]["total_kb"] / (1024 * 1024),
-                "xcode_dev_gb": scan_results["xcode_dev"]["total_kb"] / (1024 * 1024),
-                "logs_gb": scan_results["logs"]["total_kb"] / (1024 * 1024),
-                "trash_gb": scan_results["trash"]["total_kb"] / (1024 * 1024),
-                "downloads_gb": scan_results["downloads"]["total_kb"] / (1024 * 1024),
-                "projects_gb": scan_results["projects"]["total_kb"] / (1024 * 1024),
-                "app_support_gb": scan_results["app_support"]["total_kb"] / (1024 * 1024),
             },
             "recommendations": recommendations,
         }
-        print(json.dumps(output, indent=2))
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(
+                orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                + b"\n"
+            )
+            sys.stdout.flush()
+        else:
+            print(json.dumps(output, indent=2))
     else:
         from display import render_full_report
-        render_full_report(scan_results, recommendations)
+        render_full_report(scan_results, recommendations, summaries)
 
 
 def cmd_report(args: argparse.Namespace) -> None:
@@ -91,8 +117,7 @@ def cmd_clean(args: argparse.Namespace) -> None:
     console = Console()
     console.print("\n[yellow]Generating safe cleanup commands...[/yellow]\n")
 
-    from scanner import run_scan
-    scan_results = run_scan(base_path)
+    scan_results = _scan(base_path, args)
 
     from recommender import generate_recommendations
     recommendations = generate_recommendations(scan_results)
@@ -109,62 +134,61 @@ def cmd_clean(args: argparse.Namespace) -> None:
         console.print(f"   [red]{rec['command']}[/red]\n")
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(
-        prog="analyzer",
-        description="Mac Storage Analyzer — find and reclaim disk space",
-    )
-    parser.add_argument(
+def _add_common(
+    p: argparse.ArgumentParser, with_json: bool = True, subcommand: bool = False
+) -> None:
+    """
+    Register the options shared by the top-level parser and subcommands.
+
+    Subcommand copies get no default, so an option given before the
+    subcommand (e.g. ``--no-cache scan``) isn't reset by the subparser.
+    """
+
+    def default(value):
+        return argparse.SUPPRESS if subcommand else value
+
+    p.add_argument(
         "--path",
-        default="~",
+        default=default("~"),
         help="Root path to scan (default: ~)",
     )
-    parser.add_argument(
-        "--json",
+    if with_json:
+        p.add_argument(
+            "--json",
+            action="store_true",
+            default=default(False),
+            help="Output results as JSON instead of rich terminal display",
+        )
+    p.add_argument(
+        "--no-cache",
         action="store_true",
-        default=False,
-        help="Output results as JSON instead of rich terminal display",
+        default=default(False),
+        help="Ignore cached results from a recent scan and rescan",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="analyzer",
+        description="Mac Storage Analyzer — find and reclaim disk space",
     )
+    _add_common(parser)
 
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # scan command
     scan_parser = subparsers.add_parser("scan", help="Scan disk and show report")
-    scan_parser.add_argument(
-        "--path",
-        default="~",
-        help="Root path to scan (default: ~)",
-    )
-    scan_parser.add_argument(
-        "--json",
-        action="store_true",
-        default=False,
-        help="Output results as JSON",
-    )
+    _add_common(scan_parser, subcommand=True)
 
     # report command (alias)
     report_parser = subparsers.add_parser("report", help="Alias for scan")
-    report_parser.add_argument(
-        "--path",
-        default="~",
-        help="Root path to scan (default: ~)",
-    )
-    report_parser.add_argument(
-        "--json",
-        action="store_true",
-        default=False,
-        help="Output results as JSON",
-    )
+    _add_common(report_parser, subcommand=True)
 
     # clean command
     clean_parser = subparsers.add_parser(
         "clean", help="Show safe cleanup commands"
     )
-    clean_parser.add_argument(
-        "--path",
-        default="~",
-        help="Root path to scan (default: ~)",
-    )
+    _add_common(clean_parser, with_json=False, subcommand=True)
 
     args = parser.parse_args()
 
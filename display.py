@@ -1,24 +1,53 @@
 """
 Terminal display module using Rich for colored output.
+
+Rich is imported inside the render functions so that importing this module
+(or running in --json mode) does not pay Rich's import cost.
 """
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn
-from rich.text import Text
-from rich import box
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional
+
+from scanner import KB_TO_GB, CategorySummary, kb_to_gb, summarize_categories
+
+__all__ = [
+    "Row",
+    "render_category_table",
+    "render_disk_overview",
+    "render_full_report",
+    "render_legend",
+    "render_node_modules",
+    "render_recommendations",
+    "render_top_projects",
+]
+
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+_BAR_MAX_WIDTH = 80
+_BAR_FULL = "█" * _BAR_MAX_WIDTH
+_BAR_EMPTY = "░" * _BAR_MAX_WIDTH
 
-from scanner import kb_to_gb
 
-console = Console()
+@lru_cache(maxsize=1024)
+def _fmt_tenths(tenths: int) -> str:
+    """Format a size given in tenths of a GB; cached since reports repeat values."""
+    return f"{tenths / 10:.1f} GB"
 
 
 def _fmt_gb(gb: float) -> str:
     """Format a GB value to a human-readable string."""
     if gb < 0.1:
         return "< 0.1 GB"
-    return f"{gb:.1f} GB"
+    return _fmt_tenths(round(gb * 10))
 
 
 def _disk_bar(used_gb: float, total_gb: float, width: int = 40) -> str:
@@ -27,12 +56,17 @@ def _disk_bar(used_gb: float, total_gb: float, width: int = 40) -> str:
         return "[" + "-" * width + "]"
     ratio = min(used_gb / total_gb, 1.0)
     filled = int(ratio * width)
-    bar = "█" * filled + "░" * (width - filled)
-    return bar
+    if width > _BAR_MAX_WIDTH:
+        return "█" * filled + "░" * (width - filled)
+    # Slice prebuilt strings: one allocation for the concatenation only
+    return _BAR_FULL[:filled] + _BAR_EMPTY[: width - filled]
 
 
-def render_disk_overview(disk: dict) -> None:
-    """Render the disk overview panel."""
+def _disk_overview_parts(disk: dict) -> list:
+    """Build the disk overview panel."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     used = disk["used_gb"]
     total = disk["total_gb"]
     free = disk["free_gb"]
@@ -61,18 +95,24 @@ def render_disk_overview(disk: dict) -> None:
     text.append(bar, style=bar_style)
     text.append(f"]  {pct:.0f}% used", style="dim")
 
-    console.print(
+    return [
         Panel(
             text,
             title="[bold cyan]Mac Storage Analyzer[/bold cyan]",
             border_style="cyan",
             padding=(0, 1),
         )
-    )
+    ]
 
 
-def render_category_table(scan_results: dict) -> None:
-    """Render a table of storage categories and their sizes."""
+def _category_table_parts(
+    scan_results: dict, summaries: Optional[dict[str, CategorySummary]] = None
+) -> list:
+    """Build a table of storage categories and their sizes."""
+    from rich import box
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(
         title="[bold]Category Breakdown[/bold]",
         box=box.ROUNDED,
@@ -86,18 +126,18 @@ def render_category_table(scan_results: dict) -> None:
     table.add_column("Status", min_width=12)
     table.add_column("Recommendation", min_width=38)
 
-    rows = _build_category_rows(scan_results)
+    rows = _build_category_rows(scan_results, summaries)
 
     for row in rows:
-        size_gb = row["size_gb"]
+        size_gb = row.size_gb
         if size_gb < 0.05:
             continue  # Skip near-zero entries
 
         size_str = _fmt_gb(size_gb)
-        if row["safe"]:
+        if row.safe:
             status = Text("SAFE", style="bold red")
             size_style = "red"
-        elif row["can_delete"]:
+        elif row.can_delete:
             status = Text("REVIEW", style="bold yellow")
             size_style = "yellow"
         else:
@@ -105,151 +145,63 @@ def render_category_table(scan_results: dict) -> None:
             size_style = "green"
 
         table.add_row(
-            f"{row['emoji']} {row['name']}",
+            f"{row.emoji} {row.name}",
             Text(size_str, style=size_style),
             status,
-            row["recommendation"],
+            row.recommendation,
         )
 
-    console.print()
-    console.print(table)
-
-
-def _build_category_rows(scan_results: dict) -> list[dict]:
-    """Extract display rows from scan results."""
+    return [Text(), table]
+
+
+Row = namedtuple("Row", "name emoji size_gb safe can_delete recommendation")
+
+# (name, emoji, scan key, safe, can_delete, recommendation)
+_CATEGORY_ROWS = (
+    ("Docker", "🐳", "docker", True, True, "docker system prune -a"),
+    ("node_modules", "📦", "node_modules", True, True, "find & delete, restore with npm install"),
+    ("Python venvs", "🐍", "python_venv", True, True, "remove unused venvs"),
+    ("ML Models", "🤖", "ml_models", False, False, "review model files before deleting"),
+    ("Caches", "💾", "caches", True, True, "rm -rf ~/Library/Caches/*"),
+    ("Xcode/Dev", "🛠", "xcode_dev", False, False, "Xcode > Settings > Platforms"),
+    ("App Support", "🔧", "app_support", False, False, "review uninstalled app data"),
+    ("Logs", "📋", "logs", True, True, "rm -rf ~/Library/Logs/*"),
+    ("Trash", "🗑", "trash", True, True, "Empty Trash in Finder"),
+    ("Downloads", "⬇️", "downloads", False, False, "review ~/Downloads manually"),
+    ("Projects", "🗂", "projects", False, False, "archive or delete old projects"),
+)
+
+
+def _build_category_rows(
+    scan_results: dict, summaries: Optional[dict[str, CategorySummary]] = None
+) -> list[Row]:
+    """Extract display rows from scan results (or their prebuilt summaries)."""
+    if summaries is None:
+        summaries = summarize_categories(scan_results)
     rows = []
 
-    # Docker
-    docker = scan_results.get("docker", {})
-    if docker.get("available"):
-        rows.append({
-            "name": "Docker",
-            "emoji": "🐳",
-            "size_gb": kb_to_gb(docker.get("total_kb", 0)),
-            "safe": True,
-            "can_delete": True,
-            "recommendation": "docker system prune -a",
-        })
-
-    # node_modules
-    node_kb = scan_results.get("node_modules", {}).get("total_kb", 0)
-    rows.append({
-        "name": "node_modules",
-        "emoji": "📦",
-        "size_gb": kb_to_gb(node_kb),
-        "safe": True,
-        "can_delete": True,
-        "recommendation": "find & delete, restore with npm install",
-    })
-
-    # Python venvs
-    venv_kb = scan_results.get("python_venv", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Python venvs",
-        "emoji": "🐍",
-        "size_gb": kb_to_gb(venv_kb),
-        "safe": True,
-        "can_delete": True,
-        "recommendation": "remove unused venvs",
-    })
-
-    # ML Models
-    ml_kb = scan_results.get("ml_models", {}).get("total_kb", 0)
-    rows.append({
-        "name": "ML Models",
-        "emoji": "🤖",
-        "size_gb": kb_to_gb(ml_kb),
-        "safe": False,
-        "can_delete": False,
-        "recommendation": "review model files before deleting",
-    })
-
-    # Caches
-    cache_kb = scan_results.get("caches", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Caches",
-        "emoji": "💾",
-        "size_gb": kb_to_gb(cache_kb),
-        "safe": True,
-        "can_delete": True,
-        "recommendation": "rm -rf ~/Library/Caches/*",
-    })
-
-    # Xcode/Dev
-    xcode_kb = scan_results.get("xcode_dev", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Xcode/Dev",
-        "emoji": "🛠",
-        "size_gb": kb_to_gb(xcode_kb),
-        "safe": False,
-        "can_delete": False,
-        "recommendation": "Xcode > Settings > Platforms",
-    })
-
-    # App Support
-    app_kb = scan_results.get("app_support", {}).get("total_kb", 0)
-    rows.append({
-        "name": "App Support",
-        "emoji": "🔧",
-        "size_gb": kb_to_gb(app_kb),
-        "safe": False,
-        "can_delete": False,
-        "recommendation": "review uninstalled app data",
-    })
-
-    # Logs
-    logs_kb = scan_results.get("logs", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Logs",
-        "emoji": "📋",
-        "size_gb": kb_to_gb(logs_kb),
-        "safe": True,
-        "can_delete": True,
-        "recommendation": "rm -rf ~/Library/Logs/*",
-    })
-
-    # Trash
-    trash_kb = scan_results.get("trash", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Trash",
-        "emoji": "🗑",
-        "size_gb": kb_to_gb(trash_kb),
-        "safe": True,
-        "can_delete": True,
-        "recommendation": "Empty Trash in Finder",
-    })
-
-    # Downloads
-    downloads_kb = scan_results.get("downloads", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Downloads",
-        "emoji": "⬇️",
-        "size_gb": kb_to_gb(downloads_kb),
-        "safe": False,
-        "can_delete": False,
-        "recommendation": "review ~/Downloads manually",
-    })
-
-    # Projects
-    projects_kb = scan_results.get("projects", {}).get("total_kb", 0)
-    rows.append({
-        "name": "Projects",
-        "emoji": "🗂",
-        "size_gb": kb_to_gb(projects_kb),
-        "safe": False,
-        "can_delete": False,
-        "recommendation": "archive or delete old projects",
-    })
+    for name, emoji, key, safe, can_delete, recommendation in _CATEGORY_ROWS:
+        summary = summaries[key]
+        # e.g. Docker only gets a row when the CLI is installed
+        if not summary.available:
+            continue
+        rows.append(
+            Row(name, emoji, summary.total_kb * KB_TO_GB, safe, can_delete, recommendation)
+        )
 
     # Sort by size descending
-    return sorted(rows, key=lambda r: r["size_gb"], reverse=True)
+    return sorted(rows, key=attrgetter("size_gb"), reverse=True)
 
 
-def render_top_projects(scan_results: dict) -> None:
-    """Render top projects by size."""
+def _top_projects_parts(scan_results: dict) -> list:
+    """Build the top projects by size table."""
+    from rich import box
+    from rich.table import Table
+    from rich.text import Text
+
     items = scan_results.get("projects", {}).get("items", [])
     if not items:
-        return
+        return []
 
     table = Table(
         title="[bold]Top Projects by Size[/bold]",
@@ -267,15 +219,18 @@ def render_top_projects(scan_results: dict) -> None:
         size_gb = kb_to_gb(item["size_kb"])
         table.add_row(str(i), item["name"], _fmt_gb(size_gb))
 
-    console.print()
-    console.print(table)
+    return [Text(), table]
 
 
-def render_node_modules(scan_results: dict) -> None:
-    """Render found node_modules directories."""
+def _node_modules_parts(scan_results: dict) -> list:
+    """Build the table of found node_modules directories."""
+    from rich import box
+    from rich.table import Table
+    from rich.text import Text
+
     items = scan_results.get("node_modules", {}).get("items", [])
     if not items:
-        return
+        return []
 
     table = Table(
         title="[bold]node_modules Directories[/bold]",
@@ -292,21 +247,22 @@ def render_node_modules(scan_results: dict) -> None:
         size_gb = kb_to_gb(item["size_kb"])
         table.add_row(item["path"], _fmt_gb(size_gb))
 
-    console.print()
-    console.print(table)
+    return [Text(), table]
 
 
-def render_recommendations(recommendations: list[dict]) -> None:
-    """Render prioritized recommendations."""
+def _recommendations_parts(recommendations: list[dict]) -> list:
+    """Build the prioritized recommendations."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     if not recommendations:
-        console.print("\n[green]No major cleanup recommendations.[/green]")
-        return
+        return ["\n[green]No major cleanup recommendations.[/green]"]
 
     total_safe_gb = sum(r["size_gb"] for r in recommendations if r["safe"])
     total_review_gb = sum(r["size_gb"] for r in recommendations if not r["safe"])
 
-    console.print()
-    console.print(
+    parts = [
+        Text(),
         Panel(
             f"[bold]Potential savings:[/bold]  "
             f"[red]{_fmt_gb(total_safe_gb)} safe to delete[/red]  +  "
@@ -314,8 +270,8 @@ def render_recommendations(recommendations: list[dict]) -> None:
             f"= [bold white]{_fmt_gb(total_safe_gb + total_review_gb)} total[/bold white]",
             title="[bold yellow]Recommendations (by savings)[/bold yellow]",
             border_style="yellow",
-        )
-    )
+        ),
+    ]
 
     for i, rec in enumerate(recommendations, start=1):
         if rec["safe"]:
@@ -325,20 +281,25 @@ def render_recommendations(recommendations: list[dict]) -> None:
             tag = Text("[REVIEW] ", style="bold yellow")
             cmd_style = "yellow"
 
-        console.print()
         line = Text()
         line.append(f"{i}. ", style="bold white")
         line.append_text(tag)
         line.append(rec["label"], style="bold")
         line.append(f": saves {_fmt_gb(rec['size_gb'])}", style="dim")
-        console.print(line)
-        console.print(f"   [dim]{rec['action']}[/dim]")
-        console.print(f"   [bold {cmd_style}]→ {rec['command']}[/bold {cmd_style}]")
+        parts += [
+            Text(),
+            line,
+            f"   [dim]{rec['action']}[/dim]",
+            f"   [bold {cmd_style}]→ {rec['command']}[/bold {cmd_style}]",
+        ]
 
+    return parts
+
+
+def _legend_parts() -> list:
+    """Build the color legend."""
+    from rich.text import Text
 
-def render_legend() -> None:
-    """Print color legend."""
-    console.print()
     legend = Text()
     legend.append("Legend:  ", style="dim")
     legend.append("■ SAFE", style="bold red")
@@ -347,15 +308,67 @@ def render_legend() -> None:
     legend.append(" = check before deleting   ", style="dim")
     legend.append("■ KEEP", style="bold green")
     legend.append(" = do not delete", style="dim")
-    console.print(legend)
-
-
-def render_full_report(scan_results: dict, recommendations: list[dict]) -> None:
-    """Render the complete report to the terminal."""
-    render_disk_overview(scan_results["disk"])
-    render_category_table(scan_results)
-    render_top_projects(scan_results)
-    render_node_modules(scan_results)
-    render_recommendations(recommendations)
-    render_legend()
-    console.print()
+    return [Text(), legend]
+
+
+def _print_parts(parts: list) -> None:
+    """Print renderables as one Group so Rich lays them out in a single pass."""
+    from rich.console import Group
+
+    _get_console().print(Group(*parts))
+
+
+def render_disk_overview(disk: dict) -> None:
+    """Render the disk overview panel."""
+    _print_parts(_disk_overview_parts(disk))
+
+
+def render_category_table(
+    scan_results: dict, summaries: Optional[dict[str, CategorySummary]] = None
+) -> None:
+    """Render a table of storage categories and their sizes."""
+    _print_parts(_category_table_parts(scan_results, summaries))
+
+
+def render_top_projects(scan_results: dict) -> None:
+    """Render top projects by size."""
+    _print_parts(_top_projects_parts(scan_results))
+
+
+def render_node_modules(scan_results: dict) -> None:
+    """Render found node_modules directories."""
+    _print_parts(_node_modules_parts(scan_results))
+
+
+def render_recommendations(recommendations: list[dict]) -> None:
+    """Render prioritized recommendations."""
+    _print_parts(_recommendations_parts(recommendations))
+
+
+def render_legend() -> None:
+    """Print color legend."""
+    _print_parts(_legend_parts())
+
+
+def render_full_report(
+    scan_results: dict,
+    recommendations: list[dict],
+    summaries: Optional[dict[str, CategorySummary]] = None,
+) -> None:
+    """
+    Render the complete report to the terminal in one print call.
+
+    summaries, if given, are the summarize_categories() result the
+    recommendations were built from, so they aren't computed twice.
+    """
+    from rich.text import Text
+
+    _print_parts([
+        *_disk_overview_parts(scan_results["disk"]),
+        *_category_table_parts(scan_results, summaries),
+        *_top_projects_parts(scan_results),
+        *_node_modules_parts(scan_results),
+        *_recommendations_parts(recommendations),
+        *_legend_parts(),
+        Text(),
+    ])
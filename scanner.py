@@ -1,23 +1,88 @@
 """
 Disk scanning engine for Mac Storage Analyzer.
-Collects sizes for all tracked categories using du, find, and subprocess.
+Collects sizes for all tracked categories using du, os.scandir, and subprocess.
 """
 
+import hashlib
+import heapq
 import os
 import subprocess
+import sys
+import threading
 import json
-from typing import Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional, Sequence
 
 HOME = os.path.expanduser("~")
 
+# Category roots, built once at import (macOS paths are always POSIX)
+_LIB = f"{HOME}/Library"
+_LIB_CACHES = f"{_LIB}/Caches"
+_LIB_LOGS = f"{_LIB}/Logs"
+_LIB_DEVELOPER = f"{_LIB}/Developer"
+_LIB_APPSUPPORT = f"{_LIB}/Application Support"
+_NPM_CACHE = f"{HOME}/.npm"
+_PROJECTS_DIR = f"{HOME}/Projects"
+
+# Fixed roots sized with du, keyed like the sizes _assemble_results reads
+_CATEGORY_PATHS = {
+    "caches_general": (_LIB_CACHES,),
+    "caches_npm": (_NPM_CACHE,),
+    "xcode_dev": (_LIB_DEVELOPER,),
+    "logs": (_LIB_LOGS,),
+    "trash": (f"{HOME}/.Trash",),
+    "downloads": (f"{HOME}/Downloads",),
+    "app_support": (_LIB_APPSUPPORT,),
+}
+
+# On-disk cache of run_scan() results, see run_scan_cached()
+_SCAN_CACHE_DIR = f"{_LIB_CACHES}/mac-storage-analyzer"
+_SCAN_CACHE_MAX_AGE = 300  # seconds
+
+# Multiply (rather than divide) by this to turn KB into GB
+KB_TO_GB = 2 ** -20
+
+# Worker threads for run_scan; every task mostly waits on a subprocess or
+# filesystem metadata, so this is bounded by disk contention, not cores
+_SCAN_WORKERS = 8
+
+# Tasks run_scan_async lets run at once, bounding concurrent du processes
+_ASYNC_CONCURRENCY = 16
+
+# Never descended into: cloud-backed folders download files on demand when
+# read, and .Trashes belongs to other volumes' trash
+_SKIP_DIRS = frozenset({"CloudStorage", "Mobile Documents", ".Trashes"})
+
+# Opt-in: on macOS, list directories with getattrlistbulk instead of scandir
+if os.environ.get("MSA_USE_BULK_STAT") == "1":
+    from _macos_fast import list_dir as _bulk_list_dir
+else:
+    _bulk_list_dir = None
+
+# On macOS, size project trees with getattrlistbulk allocation sizes
+if sys.platform == "darwin":
+    from _macos_fast import tree_alloc_kb as _tree_alloc_kb
+else:
+    _tree_alloc_kb = None
+
+# Opt-in: size paths with an in-process scandir walk instead of forking du
+_SIZE_IN_PROCESS = os.environ.get("MSA_SIZE_IN_PROCESS") == "1"
+
+
+def _run(cmd: list[str], timeout: int = 30) -> Optional[bytes]:
+    """
+    Run a subprocess command and return raw stdout, or None on failure.
 
-def _run(cmd: list[str], timeout: int = 30) -> Optional[str]:
-    """Run a subprocess command and return stdout, or None on failure."""
+    Output is left undecoded: callers parse ASCII numbers and JSON, both
+    of which work on bytes directly.
+    """
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
         return result.stdout
@@ -25,35 +90,276 @@ def _run(cmd: list[str], timeout: int = 30) -> Optional[str]:
         return None
 
 
+async def _arun(cmd: list[str], timeout: int = 30) -> Optional[bytes]:
+    """Async counterpart of _run: raw stdout, or None on failure."""
+    import asyncio
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except (FileNotFoundError, PermissionError):
+        return None
+    try:
+        out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    return out
+
+
+def _scandir_kb(path: str) -> int:
+    """
+    Return the allocated size of path in kilobytes without spawning du.
+
+    Mirrors du -sklx: sums st_blocks (512-byte units) over the whole tree,
+    stays on path's filesystem and counts hard-linked files once per link.
+    Unreadable entries are skipped. Returns 0 if path cannot be stat'ed.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return 0
+    blocks = st.st_blocks
+    root_dev = st.st_dev
+    stack = [path] if os.path.isdir(path) and not os.path.islink(path) else []
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if st.st_dev != root_dev:
+                continue
+            blocks += st.st_blocks
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+    return (blocks + 1) // 2
+
+
+# Recent sizes by path as (time.monotonic(), kb), so back-to-back scans in
+# one session don't re-walk the same trees. Only successful sizings are kept.
+_DU_CACHE_TTL = 30  # seconds
+_du_cache: dict[str, tuple[float, int]] = {}
+
+
+def _du_cache_get(path: str) -> Optional[int]:
+    """Return the cached size of path, or None if missing or expired."""
+    hit = _du_cache.get(path)
+    if hit is None or time.monotonic() - hit[0] >= _DU_CACHE_TTL:
+        return None
+    return hit[1]
+
+
+def _du_cache_put(path: str, kb: int) -> None:
+    _du_cache[path] = (time.monotonic(), kb)
+
+
+def _du_kb_cache_clear() -> None:
+    """Forget every cached du size."""
+    _du_cache.clear()
+
+
 def _du_kb(path: str) -> int:
     """Return size of path in kilobytes using du -sk. Returns 0 on error."""
-    if not os.path.exists(path):
-        return 0
-    out = _run(["du", "-sk", path], timeout=60)
-    if not out:
-        return 0
+    return _du_kb_many((path,))[path]
+
+
+# Paths per du invocation, keeping the argument list well under ARG_MAX.
+# du always reports in KB (-k): -m would round every path up to a whole
+# MB, so totals over many small trees (a few hundred node_modules or
+# projects) could be overstated by hundreds of MB, and du walks the same
+# inodes either way.
+_DU_BATCH_SIZE = 200
+
+# -l counts a hard-linked file under every path that links it. Without it
+# one du run charges each inode to the first argument that reaches it (and
+# GNU du drops arguments nested in an earlier one), so a path's size would
+# depend on which batch it landed in and where in that batch.
+_DU_CMD = ["du", "-sklx"]
+
+
+def _du_cache_split(paths: Sequence[str]) -> tuple[dict[str, int], list[str]]:
+    """
+    Return ({path: cached kb or 0}, [existing paths with no fresh cache entry]).
+
+    Paths that do not exist stay at 0 and are left out of the list, so
+    absent roots like ~/.npm never cost a du fork.
+    """
+    sizes = dict.fromkeys(paths, 0)
+    missing = []
+    for path in sizes:
+        cached = _du_cache_get(path)
+        if cached is not None:
+            sizes[path] = cached
+        elif os.path.exists(path):
+            missing.append(path)
+    return sizes, missing
+
+
+def _parse_du_output(out: Optional[bytes], sizes: dict[str, int]) -> None:
+    """Store each "<kb>\t<path>" line of du output into sizes and the cache."""
+    # du echoes each argument back verbatim; match on the raw bytes
+    by_raw = {os.fsencode(path): path for path in sizes}
+    for line in (out or b"").splitlines():
+        kb_str, _, raw = line.partition(b"\t")
+        path = by_raw.get(raw)
+        if path is None:
+            continue
+        try:
+            sizes[path] = int(kb_str)
+        except ValueError:
+            continue
+        _du_cache_put(path, sizes[path])
+
+
+def _du_kb_many(paths: Sequence[str]) -> dict[str, int]:
+    """
+    Size several paths with as few du processes as possible.
+
+    du prints one "<kb>\t<path>" line per argument, so each batch of
+    _DU_BATCH_SIZE paths costs one fork and one walk. Paths sized within
+    the last _DU_CACHE_TTL seconds are not passed to du again. Returns
+    {path: kb}; paths du could not size map to 0.
+    """
+    sizes, missing = _du_cache_split(paths)
+
+    if _SIZE_IN_PROCESS:
+        for path in missing:
+            sizes[path] = _scandir_kb(path)
+            _du_cache_put(path, sizes[path])
+        return sizes
+
+    for start in range(0, len(missing), _DU_BATCH_SIZE):
+        chunk = missing[start : start + _DU_BATCH_SIZE]
+        _parse_du_output(_run([*_DU_CMD, *chunk], timeout=300), sizes)
+    return sizes
+
+
+def _du_kb_list(paths: Sequence[str]) -> int:
+    """Sum du -sk sizes for a list of paths, using one batched du call."""
+    return sum(_du_kb_many(paths).values())
+
+
+async def _adu_kb_list(paths: Sequence[str]) -> int:
+    """Async counterpart of _du_kb_list."""
+    import asyncio
+
+    if _SIZE_IN_PROCESS:
+        return await asyncio.to_thread(_du_kb_list, paths)
+    sizes, missing = _du_cache_split(paths)
+    for start in range(0, len(missing), _DU_BATCH_SIZE):
+        chunk = missing[start : start + _DU_BATCH_SIZE]
+        _parse_du_output(await _arun([*_DU_CMD, *chunk], timeout=300), sizes)
+    return sum(sizes.values())
+
+
+def _list_dir(path: str) -> list[os.DirEntry]:
+    """List one directory, preferring getattrlistbulk when enabled."""
+    if _bulk_list_dir is not None:
+        entries = _bulk_list_dir(path)
+        if entries is not None:
+            return entries
     try:
-        return int(out.split()[0])
-    except (IndexError, ValueError):
-        return 0
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
 
 
-def _du_kb_list(paths: list[str]) -> int:
-    """Sum du -sk sizes for a list of paths."""
-    total = 0
-    for p in paths:
-        total += _du_kb(p)
-    return total
+def _walk(
+    top: str,
+    max_depth: int,
+    prune: frozenset[str] = frozenset(),
+) -> Iterator[tuple[os.DirEntry, int]]:
+    """
+    Yield (entry, depth) for everything under top, down to max_depth.
+
+    Uses os.scandir directly so callers can read the cached DirEntry type
+    and stat data instead of re-stat'ing each path. Directories named in
+    prune are yielded but not descended into. Unreadable directories are
+    skipped.
+
+    The walk stays on top's filesystem: symlinked directories, mount points
+    (e.g. iCloud's CloudStorage) and _SKIP_DIRS are never descended into,
+    and each directory inode is visited at most once.
+
+    With MSA_USE_BULK_STAT=1 on macOS, listings come from getattrlistbulk
+    and hold BulkEntry objects instead of os.DirEntry.
+    """
+    try:
+        root_dev = os.stat(top).st_dev
+    except OSError:
+        return
+    visited = set()
+
+    stack = [(top, 1)]
+    while stack:
+        path, depth = stack.pop()
+        for entry in _list_dir(path):
+            yield entry, depth
+            if (
+                depth >= max_depth
+                or entry.name in prune
+                or entry.name in _SKIP_DIRS
+                or not entry.is_dir(follow_symlinks=False)
+            ):
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            # Same device is enforced, so the inode alone identifies a dir
+            if st.st_dev != root_dev or st.st_ino in visited:
+                continue
+            visited.add(st.st_ino)
+            stack.append((entry.path, depth + 1))
 
 
 def kb_to_gb(kb: int) -> float:
     """Convert kilobytes to gigabytes."""
-    return kb / (1024 * 1024)
+    return kb * KB_TO_GB
 
 
 def scan_disk_overview() -> dict:
-    """Get overall disk usage via df -h /."""
-    out = _run(["df", "-k", "/"])
+    """Get overall disk usage of / via statvfs, falling back to df -k /."""
+    overview = _statvfs_overview()
+    if overview is None:
+        overview = _parse_df(_run(["df", "-k", "/"]))
+    return overview
+
+
+def _disk_overview(total_kb: int, used_kb: int, free_kb: int) -> dict:
+    used_pct = round(used_kb / total_kb * 100, 1) if total_kb > 0 else 0
+    return {
+        "total_gb": kb_to_gb(total_kb),
+        "used_gb": kb_to_gb(used_kb),
+        "free_gb": kb_to_gb(free_kb),
+        "used_pct": used_pct,
+    }
+
+
+def _statvfs_overview() -> Optional[dict]:
+    """Disk overview of / from one statvfs call, or None if it fails."""
+    try:
+        st = os.statvfs("/")
+    except OSError:
+        return None
+    total_kb = st.f_blocks * st.f_frsize // 1024
+    free_kb = st.f_bavail * st.f_frsize // 1024
+    return _disk_overview(total_kb, total_kb - free_kb, free_kb)
+
+
+def _parse_df(out: Optional[bytes]) -> dict:
+    """Turn df -k output for one filesystem into the disk overview dict."""
     if not out:
         return {"total_gb": 0, "used_gb": 0, "free_gb": 0, "used_pct": 0}
 
@@ -64,24 +370,52 @@ def scan_disk_overview() -> dict:
     # df -k fields: Filesystem 1024-blocks Used Available Capacity iused ifree %iused Mounted
     parts = lines[1].split()
     try:
-        total_kb = int(parts[1])
-        used_kb = int(parts[2])
-        free_kb = int(parts[3])
-        used_pct = round(used_kb / total_kb * 100, 1) if total_kb > 0 else 0
-        return {
-            "total_gb": kb_to_gb(total_kb),
-            "used_gb": kb_to_gb(used_kb),
-            "free_gb": kb_to_gb(free_kb),
-            "used_pct": used_pct,
-        }
+        return _disk_overview(int(parts[1]), int(parts[2]), int(parts[3]))
     except (IndexError, ValueError):
         return {"total_gb": 0, "used_gb": 0, "free_gb": 0, "used_pct": 0}
 
 
+# orjson (the "fast" extra) decodes docker's JSON lines in native code.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so one except fits both.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_DOCKER_DF_CMD = ["docker", "system", "df", "--format", "{{json .}}"]
+_DOCKER_TIMEOUT = 15  # seconds
+
+
 def scan_docker() -> dict:
-    """Scan Docker disk usage via docker system df."""
-    out = _run(["docker", "system", "df", "--format", "{{json .}}"], timeout=15)
-    if out is None:
+    """
+    Scan Docker disk usage via docker system df.
+
+    Output is parsed line by line as docker writes it rather than buffered
+    whole. docker is killed if it runs past _DOCKER_TIMEOUT (e.g. a wedged
+    daemon), which reports Docker as unavailable.
+    """
+    try:
+        proc = subprocess.Popen(
+            _DOCKER_DF_CMD, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+    except (FileNotFoundError, PermissionError):
+        return _parse_docker_df(None)
+
+    timer = threading.Timer(_DOCKER_TIMEOUT, proc.kill)
+    timer.start()
+    try:
+        with proc:
+            result = _parse_docker_df(proc.stdout)
+    finally:
+        timer.cancel()
+    if proc.returncode < 0:  # killed by the timer
+        return _parse_docker_df(None)
+    return result
+
+
+def _parse_docker_df(lines: Optional[Iterable[bytes]]) -> dict:
+    """Sum docker system df JSON lines into the docker result dict."""
+    if lines is None:
         return {"available": False, "total_kb": 0, "reclaimable_kb": 0, "details": {}}
 
     # docker system df --format json outputs one JSON object per line (not a JSON array)
@@ -89,12 +423,12 @@ def scan_docker() -> dict:
     reclaimable_kb = 0
     details = {}
 
-    for line in out.strip().splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             continue
         try:
-            item = json.loads(line)
+            item = _json_loads(line)
             type_name = item.get("Type", "")
             size_str = item.get("Size", "0B")
             reclaimable_str = item.get("Reclaimable", "0B")
@@ -118,126 +452,139 @@ def scan_docker() -> dict:
     }
 
 
+# Docker sizes look like "8.2GB", "512MB" or "0B"; KB multiplier per
+# two-letter unit (plain "B" is handled separately)
+_DOCKER_UNIT_KB = {
+    "TB": 1024 * 1024 * 1024,
+    "GB": 1024 * 1024,
+    "MB": 1024,
+    "KB": 1,
+    "kB": 1,
+}
+
+
 def _parse_docker_size(size_str: str) -> int:
     """Parse Docker size strings like '8.2GB', '512MB', '1.5TB' to KB."""
     size_str = size_str.strip()
-    if not size_str or size_str == "0B":
+    if not size_str.endswith("B"):
+        return 0
+    # The unit is always the last one or two characters: one dict lookup
+    # instead of trying each suffix in turn
+    mult = _DOCKER_UNIT_KB.get(size_str[-2:])
+    try:
+        if mult is None:
+            return int(float(size_str[:-1]) / 1024)
+        return int(float(size_str[:-2]) * mult)
+    except (ValueError, OverflowError):  # e.g. "1.2.3GB", "infGB"
         return 0
-    # Check longest suffixes first to avoid "GB".endswith("B") matching "B"
-    multipliers = [
-        ("TB", 1024 * 1024 * 1024),
-        ("GB", 1024 * 1024),
-        ("MB", 1024),
-        ("KB", 1),
-        ("kB", 1),
-        ("B", 1 / 1024),
-    ]
-    for suffix, mult in multipliers:
-        if size_str.endswith(suffix):
-            try:
-                value = float(size_str[: -len(suffix)])
-                return int(value * mult)
-            except ValueError:
-                return 0
-    return 0
-
-
-def scan_node_modules(base_path: str) -> list[dict]:
-    """Find node_modules directories up to depth 6."""
-    out = _run(
-        [
-            "find",
-            base_path,
-            "-name",
-            "node_modules",
-            "-type",
-            "d",
-            "-prune",
-            "-maxdepth",
-            "6",
-        ],
-        timeout=60,
-    )
-    if not out:
-        return []
 
-    results = []
-    for path in out.strip().splitlines():
-        path = path.strip()
-        if not path:
-            continue
-        size_kb = _du_kb(path)
-        results.append({"path": path, "size_kb": size_kb})
-
-    return sorted(results, key=lambda x: x["size_kb"], reverse=True)
-
-
-def scan_python_venvs(base_path: str) -> list[dict]:
-    """Find Python virtual environments by locating pyvenv.cfg files."""
-    out = _run(
-        [
-            "find",
-            base_path,
-            "-name",
-            "pyvenv.cfg",
-            "-maxdepth",
-            "8",
-        ],
-        timeout=60,
-    )
-    if not out:
-        return []
 
-    results = []
-    seen = set()
-    for cfg_path in out.strip().splitlines():
-        cfg_path = cfg_path.strip()
-        if not cfg_path:
-            continue
-        venv_dir = os.path.dirname(cfg_path)
-        if venv_dir in seen:
-            continue
-        seen.add(venv_dir)
-        size_kb = _du_kb(venv_dir)
-        results.append({"path": venv_dir, "size_kb": size_kb})
-
-    return sorted(results, key=lambda x: x["size_kb"], reverse=True)
-
-
-def scan_ml_models(base_path: str) -> list[dict]:
-    """Find large ML model files (>100MB) with common extensions."""
-    extensions = [".pt", ".pkl", ".h5", ".ckpt", ".safetensors", ".bin"]
-    results = []
-
-    for ext in extensions:
-        out = _run(
-            [
-                "find",
-                base_path,
-                "-name",
-                f"*{ext}",
-                "-type",
-                "f",
-                "-size",
-                "+100M",
-                "-maxdepth",
-                "10",
-            ],
-            timeout=60,
-        )
-        if not out:
-            continue
-        for path in out.strip().splitlines():
-            path = path.strip()
-            if not path or not os.path.exists(path):
+_ML_EXTS = frozenset({".pt", ".pkl", ".h5", ".ckpt", ".safetensors", ".bin"})
+_ML_MIN_BYTES = 100 * 1024 * 1024
+
+# Never descended into by the target walk: node_modules is sized whole,
+# and the rest never hold a venv or model file worth reporting
+# (Library/Caches is already its own category)
+_TARGET_PRUNE = frozenset({"node_modules", ".git", "__pycache__", "Caches"})
+
+# Deepest level each target is looked for at, relative to base_path
+_NODE_MODULES_DEPTH = 6
+_VENV_DEPTH = 8
+_ML_DEPTH = 10
+
+
+def _find_all_targets(base_path: str) -> dict[str, list]:
+    """
+    Walk base_path once and collect every scanner's targets.
+
+    Returns {"node_modules": [...], "python_venv": [...], "ml_models": [...]}
+    with node_modules directory paths (depth <= 6), virtualenv directory
+    paths holding a pyvenv.cfg (depth <= 8) and {"path", "size_kb", "ext"}
+    dicts for ML model files over 100MB (depth <= 10). Directories named
+    in _TARGET_PRUNE are never descended into; for node_modules, nested
+    copies and anything else inside are already part of its size.
+    """
+    targets: dict[str, list] = {"node_modules": [], "python_venv": [], "ml_models": []}
+    for entry, depth in _walk(base_path, _ML_DEPTH, prune=_TARGET_PRUNE):
+        name = entry.name
+        if name == "node_modules":
+            if depth <= _NODE_MODULES_DEPTH and entry.is_dir(follow_symlinks=False):
+                targets["node_modules"].append(entry.path)
+        elif name == "pyvenv.cfg":
+            if depth <= _VENV_DEPTH:
+                targets["python_venv"].append(os.path.dirname(entry.path))
+        else:
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in _ML_EXTS or not entry.is_file(follow_symlinks=False):
                 continue
             try:
-                size_kb = os.path.getsize(path) // 1024
+                size = entry.stat(follow_symlinks=False).st_size
             except OSError:
-                size_kb = 0
-            results.append({"path": path, "size_kb": size_kb, "ext": ext})
+                continue
+            if size > _ML_MIN_BYTES:
+                targets["ml_models"].append(
+                    {"path": entry.path, "size_kb": size // 1024, "ext": ext}
+                )
+    return targets
+
+
+def _sized_items(sizes: dict[str, int]) -> list[dict]:
+    """Turn {path: kb} into [{"path", "size_kb"}] dicts, largest first."""
+    ordered = sorted(sizes, key=sizes.__getitem__, reverse=True)
+    return [{"path": path, "size_kb": sizes[path]} for path in ordered]
+
+
+def scan_node_modules(
+    base_path: str,
+    found: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Size node_modules directories up to depth 6.
+
+    found holds the directories from _find_all_targets(); when omitted,
+    base_path is walked to find them.
+    """
+    paths = found
+    if paths is None:
+        paths = _find_all_targets(base_path)["node_modules"]
 
-    return sorted(results, key=lambda x: x["size_kb"], reverse=True)
+    return _sized_items(_du_kb_many(paths))
+
+
+def scan_python_venvs(
+    base_path: str,
+    found: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Size Python virtual environments (directories holding a pyvenv.cfg).
+
+    found holds the directories from _find_all_targets(); when omitted,
+    base_path is walked to find them.
+    """
+    paths = found
+    if paths is None:
+        paths = _find_all_targets(base_path)["python_venv"]
+
+    # dict.fromkeys drops duplicates in C while keeping first-seen order
+    return _sized_items(_du_kb_many(list(dict.fromkeys(paths))))
+
+
+def scan_ml_models(
+    base_path: str,
+    found: Optional[list[dict]] = None,
+) -> list[dict]:
+    """
+    List large ML model files (>100MB) with common extensions.
+
+    found holds the model dicts from _find_all_targets(), already sized
+    by the walk's single stat per file; when omitted, base_path is walked
+    to find them.
+    """
+    models = found
+    if models is None:
+        models = _find_all_targets(base_path)["ml_models"]
+
+    return sorted(models, key=itemgetter("size_kb"), reverse=True)
 
 
 def scan_path(path: str) -> int:
@@ -245,26 +592,78 @@ def scan_path(path: str) -> int:
     return _du_kb(path)
 
 
+def _bulk_kb_many(paths: list[str]) -> dict[str, int]:
+    """Size paths with _tree_alloc_kb, sending any it can't read to du."""
+    sizes = dict.fromkeys(paths, 0)
+    fallback = []
+    for path in paths:
+        kb = _tree_alloc_kb(path)
+        if kb is None:
+            fallback.append(path)
+        else:
+            sizes[path] = kb
+    sizes.update(_du_kb_many(fallback))
+    return sizes
+
+
 def scan_top_projects(projects_dir: str, top_n: int = 10) -> list[dict]:
     """Return the top N largest subdirectories under projects_dir."""
-    if not os.path.exists(projects_dir):
-        return []
-
+    # is_dir() answers from the dirent type, so no stat per entry
     try:
-        entries = [
-            os.path.join(projects_dir, e)
-            for e in os.listdir(projects_dir)
-            if os.path.isdir(os.path.join(projects_dir, e))
-        ]
-    except PermissionError:
+        with os.scandir(projects_dir) as it:
+            entries = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
         return []
 
-    results = []
-    for entry in entries:
-        size_kb = _du_kb(entry)
-        results.append({"path": entry, "name": os.path.basename(entry), "size_kb": size_kb})
+    if _tree_alloc_kb is None:
+        sizes = _du_kb_many(entries)
+    else:
+        sizes = _bulk_kb_many(entries)
+
+    # Only the top N are kept, so select them in O(n log N) instead of
+    # sorting every project directory, and build dicts for those alone.
+    top = heapq.nlargest(top_n, sizes, key=sizes.__getitem__)
+    return [
+        {"path": path, "name": os.path.basename(path), "size_kb": sizes[path]}
+        for path in top
+    ]
+
+
+# Results filled from the shared walk of base_path
+_TREE_KEYS = ("node_modules", "python_venv", "ml_models")
 
-    return sorted(results, key=lambda x: x["size_kb"], reverse=True)[:top_n]
+
+def _assemble_results(base_path: str, done: dict) -> dict:
+    """Build run_scan's result dict from each finished task's return value."""
+    results = {
+        "base_path": base_path,
+        "disk": done["disk"],
+        "docker": done["docker"],
+    }
+
+    # Item categories carry their own total
+    for key in ("node_modules", "python_venv", "ml_models", "projects"):
+        items = done[key]
+        results[key] = {
+            "items": items,
+            "total_kb": sum(map(itemgetter("size_kb"), items)),
+        }
+
+    # Caches breakdown
+    general_kb = done["caches_general"]
+    npm_kb = done["caches_npm"]
+    results["caches"] = {
+        "total_kb": general_kb + npm_kb,
+        "breakdown": {
+            "general": {"path": _LIB_CACHES, "size_kb": general_kb},
+            "npm": {"path": _NPM_CACHE, "size_kb": npm_kb},
+        },
+    }
+
+    for key in ("xcode_dev", "logs", "trash", "downloads", "app_support"):
+        results[key] = {"total_kb": done[key]}
+
+    return results
 
 
 def run_scan(base_path: str = HOME) -> dict:
@@ -273,105 +672,199 @@ def run_scan(base_path: str = HOME) -> dict:
 
     Returns a dict with keys for each category and disk overview.
     """
-    results = {
-        "base_path": base_path,
-        "disk": scan_disk_overview(),
-        "docker": scan_docker(),
-        "node_modules": {
-            "items": scan_node_modules(base_path),
-            "total_kb": 0,
-        },
-        "python_venv": {
-            "items": scan_python_venvs(base_path),
-            "total_kb": 0,
-        },
-        "ml_models": {
-            "items": scan_ml_models(base_path),
-            "total_kb": 0,
-        },
-        "caches": {
-            "total_kb": 0,
-            "breakdown": {},
-        },
-        "xcode_dev": {
-            "total_kb": 0,
-        },
-        "logs": {
-            "total_kb": 0,
-        },
-        "trash": {
-            "total_kb": 0,
-        },
-        "downloads": {
-            "total_kb": 0,
-        },
-        "projects": {
-            "items": [],
-            "total_kb": 0,
-        },
-        "app_support": {
-            "total_kb": 0,
-        },
-    }
+    # A missing base_path has nothing to walk; skip the tree scanners
+    have_base = os.path.isdir(base_path)
+    done = {} if have_base else {key: [] for key in _TREE_KEYS}
+
+    # Every scanner and category root is independent and I/O-bound, so run
+    # them all at once: wall time becomes the slowest task, not the sum.
+    # The three tree scanners share one walk of base_path and are only
+    # submitted once it finishes, so they never hold a worker while waiting.
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        futures = {
+            pool.submit(scan_disk_overview): "disk",
+            pool.submit(scan_docker): "docker",
+            pool.submit(scan_top_projects, _PROJECTS_DIR): "projects",
+        }
+        if have_base:
+            futures[pool.submit(_find_all_targets, base_path)] = "targets"
+        for key, paths in _CATEGORY_PATHS.items():
+            futures[pool.submit(_du_kb_list, paths)] = key
+
+        pending = set(futures)
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = futures[future]
+                if key != "targets":
+                    done[key] = future.result()
+                    continue
+                found = future.result()
+                scanners = (scan_node_modules, scan_python_venvs, scan_ml_models)
+                for tree_key, scan in zip(_TREE_KEYS, scanners):
+                    sizing = pool.submit(scan, base_path, found=found[tree_key])
+                    futures[sizing] = tree_key
+                    pending.add(sizing)
+
+    return _assemble_results(base_path, done)
+
+
+async def run_scan_async(base_path: str = HOME) -> dict:
+    """
+    Async counterpart of run_scan for callers already running an event loop.
 
-    # Aggregate node_modules total
-    results["node_modules"]["total_kb"] = sum(
-        i["size_kb"] for i in results["node_modules"]["items"]
-    )
+    docker, the category du roots and any df fallback are awaited as
+    subprocesses; the in-process tree walk and the per-target scanners run
+    in worker threads. At most _ASYNC_CONCURRENCY tasks run at once.
+    """
+    # Imported here, not at module level: the CLI never takes the async
+    # path, and asyncio would otherwise dominate `import scanner`.
+    import asyncio
 
-    # Aggregate python venv total
-    results["python_venv"]["total_kb"] = sum(
-        i["size_kb"] for i in results["python_venv"]["items"]
-    )
+    limit = asyncio.Semaphore(_ASYNC_CONCURRENCY)
 
-    # Aggregate ML models total
-    results["ml_models"]["total_kb"] = sum(
-        i["size_kb"] for i in results["ml_models"]["items"]
-    )
+    async def bounded(coro):
+        async with limit:
+            return await coro
 
-    # Caches breakdown
-    cache_paths = {
-        "general": os.path.join(HOME, "Library", "Caches"),
-        "npm": os.path.join(HOME, ".npm"),
-        "pip": os.path.join(HOME, "Library", "Caches", "pip"),
-        "homebrew": os.path.join(HOME, "Library", "Caches", "Homebrew"),
-    }
-    cache_total = 0
-    # Scan general caches first, then individual sub-caches
-    general_kb = _du_kb(cache_paths["general"])
-    npm_kb = _du_kb(cache_paths["npm"])
-
-    results["caches"]["breakdown"] = {
-        "general": {"path": cache_paths["general"], "size_kb": general_kb},
-        "npm": {"path": cache_paths["npm"], "size_kb": npm_kb},
+    have_base = os.path.isdir(base_path)
+    if have_base:
+        targets = asyncio.create_task(
+            bounded(asyncio.to_thread(_find_all_targets, base_path))
+        )
+
+    async def size_targets(scan, key: str) -> list[dict]:
+        if not have_base:
+            return []
+        found = (await targets)[key]
+        return await bounded(asyncio.to_thread(scan, base_path, found=found))
+
+    async def disk() -> dict:
+        overview = _statvfs_overview()
+        if overview is None:
+            overview = _parse_df(await _arun(["df", "-k", "/"]))
+        return overview
+
+    async def docker() -> dict:
+        out = await _arun(_DOCKER_DF_CMD, timeout=_DOCKER_TIMEOUT)
+        return _parse_docker_df(None if out is None else out.splitlines())
+
+    tasks = {
+        "disk": bounded(disk()),
+        "docker": bounded(docker()),
+        "node_modules": size_targets(scan_node_modules, "node_modules"),
+        "python_venv": size_targets(scan_python_venvs, "python_venv"),
+        "ml_models": size_targets(scan_ml_models, "ml_models"),
+        "projects": bounded(asyncio.to_thread(scan_top_projects, _PROJECTS_DIR)),
     }
-    cache_total = general_kb + npm_kb
-    results["caches"]["total_kb"] = cache_total
+    for key, paths in _CATEGORY_PATHS.items():
+        tasks[key] = bounded(_adu_kb_list(paths))
+    values = await asyncio.gather(*tasks.values())
+
+    return _assemble_results(base_path, dict(zip(tasks, values)))
+
+
+def _scan_cache_path(base_path: str) -> str:
+    """
+    Return the cache file for a scan of base_path.
 
-    # Xcode / Developer
-    xcode_path = os.path.join(HOME, "Library", "Developer")
-    results["xcode_dev"]["total_kb"] = _du_kb(xcode_path)
+    The name hashes base_path together with the mtime of every scanned
+    root, so adding or removing entries directly under any root selects a
+    different file.
+    """
+    roots = [base_path, _PROJECTS_DIR]
+    for paths in _CATEGORY_PATHS.values():
+        roots.extend(paths)
+    digest = hashlib.blake2b(digest_size=16)
+    for root in roots:
+        try:
+            mtime_ns = os.stat(root).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        digest.update(f"{root}\0{mtime_ns}\0".encode())
+    return os.path.join(_SCAN_CACHE_DIR, digest.hexdigest() + ".json")
 
-    # Logs
-    logs_path = os.path.join(HOME, "Library", "Logs")
-    results["logs"]["total_kb"] = _du_kb(logs_path)
 
-    # Trash
-    trash_path = os.path.join(HOME, ".Trash")
-    results["trash"]["total_kb"] = _du_kb(trash_path)
+def run_scan_cached(base_path: str = HOME, max_age: float = _SCAN_CACHE_MAX_AGE) -> dict:
+    """
+    Like run_scan(), but reuse a result saved by a recent identical scan.
 
-    # Downloads
-    downloads_path = os.path.join(HOME, "Downloads")
-    results["downloads"]["total_kb"] = _du_kb(downloads_path)
+    A cached result is served when it is younger than max_age seconds and
+    none of the scanned roots' mtimes changed. Cache I/O errors never fail
+    the scan; they just fall through to a fresh run_scan().
+    """
+    # Create the cache dir before hashing: it lives under ~/Library/Caches,
+    # a hashed root, so creating it later would change the key just written
+    try:
+        os.makedirs(_SCAN_CACHE_DIR, exist_ok=True)
+    except OSError:
+        pass
+    cache_path = _scan_cache_path(base_path)
+    now = time.time()
+    try:
+        if now - os.path.getmtime(cache_path) < max_age:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
 
-    # Projects
-    projects_path = os.path.join(HOME, "Projects")
-    project_items = scan_top_projects(projects_path)
-    results["projects"]["items"] = project_items
-    results["projects"]["total_kb"] = sum(i["size_kb"] for i in project_items)
+    results = run_scan(base_path)
 
-    # App Support
-    app_support_path = os.path.join(HOME, "Library", "Application Support")
-    results["app_support"]["total_kb"] = _du_kb(app_support_path)
+    try:
+        # Drop results that have expired or were keyed on old mtimes
+        with os.scandir(_SCAN_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and now - entry.stat().st_mtime >= max_age:
+                    os.unlink(entry.path)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(results, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
     return results
+
+
+CATEGORY_KEYS = (
+    "docker",
+    "node_modules",
+    "python_venv",
+    "ml_models",
+    "caches",
+    "xcode_dev",
+    "logs",
+    "trash",
+    "downloads",
+    "projects",
+    "app_support",
+)
+
+
+@dataclass(slots=True)
+class CategorySummary:
+    """Sizes for one category, read once from the run_scan() dict."""
+
+    total_kb: int = 0
+    items: list = field(default_factory=list)
+    available: bool = True
+    reclaimable_kb: int = 0
+
+
+def summarize_categories(scan_results: dict) -> dict[str, CategorySummary]:
+    """
+    Build a CategorySummary for every category in one pass over scan results.
+
+    A category is available when the scan produced it; Docker also reports
+    its own flag when the CLI is missing.
+    """
+    summaries = {}
+    for key in CATEGORY_KEYS:
+        data = scan_results.get(key, {})
+        summaries[key] = CategorySummary(
+            total_kb=data.get("total_kb", 0),
+            items=data.get("items", []),
+            available=data.get("available", bool(data)),
+            reclaimable_kb=data.get("reclaimable_kb", 0),
+        )
+    return summaries
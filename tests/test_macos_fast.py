@@ -0,0 +1,96 @@
+"""Tests for _macos_fast module."""
+
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import _macos_fast
+from _macos_fast import (
+    ATTR_CMN_ERROR,
+    ATTR_CMN_NAME,
+    ATTR_CMN_OBJTYPE,
+    ATTR_CMN_RETURNED_ATTRS,
+    ATTR_FILE_ALLOCSIZE,
+    ATTR_FILE_TOTALSIZE,
+    VDIR,
+    VREG,
+    _parse_entries,
+    list_dir,
+    tree_alloc_kb,
+)
+
+
+def _record(name: str, obj_type: int, size=None, alloc=None, error=0) -> bytes:
+    """Pack one getattrlistbulk record the way the kernel lays it out."""
+    common = ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE
+    file_attrs = 0
+    fixed = b""
+    if error:
+        common |= ATTR_CMN_ERROR
+        fixed += struct.pack("=I", error)
+    name_ref_at = len(fixed)
+    fixed += b"\0" * 8  # attrreference_t placeholder
+    fixed += struct.pack("=I", obj_type)
+    if size is not None:
+        file_attrs |= ATTR_FILE_TOTALSIZE
+        fixed += struct.pack("=q", size)
+    if alloc is not None:
+        file_attrs |= ATTR_FILE_ALLOCSIZE
+        fixed += struct.pack("=q", alloc)
+
+    name_bytes = name.encode() + b"\0"
+    data_offset = len(fixed) - name_ref_at
+    fixed = (
+        fixed[:name_ref_at]
+        + struct.pack("=iI", data_offset, len(name_bytes))
+        + fixed[name_ref_at + 8 :]
+    )
+    body = struct.pack("=5I", common, 0, 0, file_attrs, 0) + fixed + name_bytes
+    body += b"\0" * (-(len(body) + 4) % 4)
+    return struct.pack("=I", len(body) + 4) + body
+
+
+class TestParseEntries:
+    def test_file_and_dir(self):
+        buf = _record("model.pt", VREG, size=5000, alloc=8192) + _record("src", VDIR)
+        entries = list(_parse_entries(buf, 2, "/base"))
+        assert [e.name for e in entries] == ["model.pt", "src"]
+        assert entries[0].path == "/base/model.pt"
+        assert entries[0].is_file() and not entries[0].is_dir()
+        assert entries[0].size == 5000
+        assert entries[0].alloc_size == 8192
+        assert entries[1].is_dir(follow_symlinks=False)
+        assert entries[1].size == 0
+
+    def test_skips_errored_records(self):
+        buf = _record("locked", VDIR, error=13) + _record("ok", VREG, size=1, alloc=4096)
+        entries = list(_parse_entries(buf, 2, "/base"))
+        assert [e.name for e in entries] == ["ok"]
+
+
+class TestListDir:
+    def test_unavailable_returns_none(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(_macos_fast, "_getattrlistbulk", None)
+        assert list_dir(str(tmp_path)) is None
+
+
+class TestTreeAllocKb:
+    def test_unavailable_returns_none(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(_macos_fast, "_getattrlistbulk", None)
+        assert tree_alloc_kb(str(tmp_path)) is None
+
+    def test_sums_alloc_sizes_recursively(self, monkeypatch, tmp_path):
+        (tmp_path / "src").mkdir()
+        base, src = str(tmp_path), str(tmp_path / "src")
+        listings = {
+            base: [
+                _macos_fast.BulkEntry("a.bin", f"{base}/a.bin", VREG, 10, 4096),
+                _macos_fast.BulkEntry("src", src, VDIR, 0, 0),
+            ],
+            src: [_macos_fast.BulkEntry("b.py", f"{src}/b.py", VREG, 10, 2048)],
+        }
+        monkeypatch.setattr(_macos_fast, "_getattrlistbulk", object())
+        monkeypatch.setattr(_macos_fast, "list_dir", listings.get)
+        assert tree_alloc_kb(base) == 6
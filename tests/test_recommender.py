@@ -2,10 +2,12 @@
 
 import os
 import sys
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from recommender import generate_recommendations
+from scanner import summarize_categories
 
 
 def _make_scan_results(**overrides):
@@ -91,6 +93,25 @@ class TestGenerateRecommendations:
         docker_recs = [r for r in recs if r["category"] == "docker"]
         assert docker_recs == []
 
+    def test_docker_available_but_empty_skipped(self):
+        results = _make_scan_results(
+            docker={"available": True, "total_kb": 0, "reclaimable_kb": 0}
+        )
+        recs = generate_recommendations(results)
+        assert [r for r in recs if r["category"] == "docker"] == []
+
+    def test_missing_categories_skipped(self):
+        recs = generate_recommendations({"trash": {"total_kb": 1024 * 1024}})
+        assert [r["category"] for r in recs] == ["trash"]
+
+    def test_reuses_given_summaries(self):
+        results = _make_scan_results(trash={"total_kb": 1024 * 1024})
+        summaries = summarize_categories(results)
+        with patch("recommender.summarize_categories") as mock_summarize:
+            recs = generate_recommendations(results, summaries)
+        mock_summarize.assert_not_called()
+        assert [r["category"] for r in recs] == ["trash"]
+
     def test_zero_size_excluded(self):
         results = _make_scan_results(
             caches={"total_kb": 0},
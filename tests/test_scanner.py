@@ -1,5 +1,6 @@
 """Tests for scanner module."""
 
+import asyncio
 import os
 from unittest.mock import patch, MagicMock
 
@@ -8,10 +9,16 @@ import pytest
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import scanner
 from scanner import (
     _run,
     _du_kb,
     _du_kb_list,
+    _du_kb_many,
+    _adu_kb_list,
+    _scandir_kb,
+    _walk,
+    _find_all_targets,
     kb_to_gb,
     _parse_docker_size,
     scan_disk_overview,
@@ -21,9 +28,20 @@ from scanner import (
     scan_ml_models,
     scan_top_projects,
     run_scan,
+    run_scan_async,
+    _arun,
+    run_scan_cached,
+    summarize_categories,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_du_cache():
+    scanner._du_kb_cache_clear()
+    yield
+    scanner._du_kb_cache_clear()
+
+
 class TestKbToGb:
     def test_zero(self):
         assert kb_to_gb(0) == 0.0
@@ -62,12 +80,21 @@ class TestParseDockerSize:
 
     def test_bad_number(self):
         assert _parse_docker_size("abcGB") == 0
+        assert _parse_docker_size("1.2.3GB") == 0
+        assert _parse_docker_size("infGB") == 0
+
+    def test_bytes_round_down(self):
+        assert _parse_docker_size("900B") == 0
+        assert _parse_docker_size("2048B") == 2
+
+    def test_lowercase_kb_and_spacing(self):
+        assert _parse_docker_size(" 12.5 kB ") == 12
 
 
 class TestRun:
     def test_success(self):
         result = _run(["echo", "hello"])
-        assert result.strip() == "hello"
+        assert result.strip() == b"hello"
 
     def test_timeout(self):
         result = _run(["sleep", "10"], timeout=1)
@@ -78,14 +105,27 @@ class TestRun:
         assert result is None
 
 
+class TestArun:
+    def test_success(self):
+        assert asyncio.run(_arun(["echo", "hello"])).strip() == b"hello"
+
+    def test_timeout(self):
+        assert asyncio.run(_arun(["sleep", "10"], timeout=1)) is None
+
+    def test_missing_command(self):
+        assert asyncio.run(_arun(["nonexistent_command_xyz"])) is None
+
+
 class TestDuKb:
-    def test_nonexistent_path(self):
+    @patch("scanner._run")
+    def test_nonexistent_path(self, mock_run):
         assert _du_kb("/nonexistent/path/xyz") == 0
+        mock_run.assert_not_called()
 
     @patch("os.path.exists", return_value=True)
     @patch("scanner._run")
     def test_valid_output(self, mock_run, mock_exists):
-        mock_run.return_value = "12345\t/some/path\n"
+        mock_run.return_value = b"12345\t/some/path\n"
         assert _du_kb("/some/path") == 12345
 
     @patch("scanner._run")
@@ -95,119 +135,400 @@ class TestDuKb:
 
     @patch("scanner._run")
     def test_malformed_output(self, mock_run):
-        mock_run.return_value = "not a number\n"
+        mock_run.return_value = b"not a number\n"
         assert _du_kb("/some/path") == 0
 
+    @patch("os.path.exists", return_value=True)
+    @patch("scanner._run", return_value=b"12345\t/some/path\n")
+    def test_repeat_call_is_cached(self, mock_run, mock_exists):
+        assert _du_kb("/some/path") == 12345
+        assert _du_kb("/some/path") == 12345
+        assert mock_run.call_count == 1
+        assert _du_kb_many(["/some/path"]) == {"/some/path": 12345}
+        assert mock_run.call_count == 1
+
+    @patch("os.path.exists", return_value=True)
+    @patch("scanner._run", return_value=b"12345\t/some/path\n")
+    def test_expired_entry_resizes(self, mock_run, mock_exists, monkeypatch):
+        monkeypatch.setattr(scanner, "_DU_CACHE_TTL", 0)
+        _du_kb("/some/path")
+        _du_kb("/some/path")
+        assert mock_run.call_count == 2
+
+
+class TestScandirKb:
+    def test_missing_path(self, tmp_path):
+        assert _scandir_kb(str(tmp_path / "missing")) == 0
+
+    def test_counts_each_hard_link(self, tmp_path):
+        (tmp_path / "f").write_bytes(b"x" * 100_000)
+        single = _scandir_kb(str(tmp_path))
+        os.link(tmp_path / "f", tmp_path / "g")
+        assert _scandir_kb(str(tmp_path)) > single
+
+    def test_nested_files_counted(self, tmp_path):
+        before = _scandir_kb(str(tmp_path))
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "f").write_bytes(b"x" * 100_000)
+        assert _scandir_kb(str(tmp_path)) > before
+
+    @patch("scanner._SIZE_IN_PROCESS", True)
+    @patch("scanner._run")
+    def test_flag_bypasses_du(self, mock_run, tmp_path):
+        (tmp_path / "f").write_bytes(b"x" * 100_000)
+        assert _du_kb(str(tmp_path)) == _scandir_kb(str(tmp_path))
+        assert _du_kb_many([str(tmp_path)]) == {str(tmp_path): _du_kb(str(tmp_path))}
+        mock_run.assert_not_called()
+
+
+class TestDuKbMany:
+    @pytest.fixture(autouse=True)
+    def _paths_exist(self, monkeypatch):
+        # The fake paths below only exist as far as du is concerned
+        monkeypatch.setattr(os.path, "exists", lambda path: True)
+
+    @patch("scanner._run")
+    def test_one_process_for_all_paths(self, mock_run):
+        mock_run.return_value = b"10\t/a\n20\t/b\n"
+        assert _du_kb_many(["/a", "/b", "/c"]) == {"/a": 10, "/b": 20, "/c": 0}
+        assert mock_run.call_count == 1
+
+    @patch("scanner._run")
+    def test_empty_list_skips_du(self, mock_run):
+        assert _du_kb_many([]) == {}
+        mock_run.assert_not_called()
+
+    @patch("scanner._run", return_value=None)
+    def test_du_failure(self, mock_run):
+        assert _du_kb_many(["/a"]) == {"/a": 0}
+        _du_kb_many(["/a"])
+        assert mock_run.call_count == 2
+
+    @patch("scanner._run")
+    def test_only_uncached_paths_hit_du(self, mock_run):
+        mock_run.side_effect = lambda cmd, timeout: "".join(f"5\t{p}\n" for p in cmd[2:]).encode()
+        _du_kb_many(["/a"])
+        assert _du_kb_many(["/a", "/b"]) == {"/a": 5, "/b": 5}
+        assert mock_run.call_args[0][0][2:] == ["/b"]
+
+    @patch("scanner._DU_BATCH_SIZE", 2)
+    @patch("scanner._run")
+    def test_chunks_long_lists(self, mock_run):
+        mock_run.side_effect = lambda cmd, timeout: "".join(f"1\t{p}\n" for p in cmd[2:]).encode()
+        assert _du_kb_many(["/a", "/b", "/c"]) == {"/a": 1, "/b": 1, "/c": 1}
+        assert [call[0][0][2:] for call in mock_run.call_args_list] == [["/a", "/b"], ["/c"]]
+
 
 class TestDuKbList:
-    @patch("scanner._du_kb")
-    def test_sums_correctly(self, mock_du):
-        mock_du.side_effect = [100, 200, 300]
+    @patch("os.path.exists", return_value=True)
+    @patch("scanner._run")
+    def test_sums_correctly(self, mock_run, mock_exists):
+        mock_run.return_value = b"100\t/a\n200\t/b\n300\t/c\n"
         result = _du_kb_list(["/a", "/b", "/c"])
         assert result == 600
+        assert mock_run.call_count == 1
 
-    @patch("scanner._du_kb")
-    def test_empty_list(self, mock_du):
+    @patch("scanner._run")
+    def test_empty_list(self, mock_run):
         assert _du_kb_list([]) == 0
+        mock_run.assert_not_called()
+
+    @patch("scanner._run")
+    def test_missing_paths_skip_du(self, mock_run, tmp_path):
+        mock_run.return_value = f"7\t{tmp_path}\n".encode()
+        missing = str(tmp_path / "missing")
+        assert _du_kb_list([missing]) == 0
+        assert _du_kb_list([missing, str(tmp_path)]) == 7
+        assert [call[0][0][2:] for call in mock_run.call_args_list] == [[str(tmp_path)]]
+
+    def test_sizes_independent_of_batch(self, tmp_path):
+        (tmp_path / "a" / "inner").mkdir(parents=True)
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "inner" / "f").write_bytes(b"x" * 100_000)
+        os.link(tmp_path / "a" / "inner" / "f", tmp_path / "b" / "g")
+        paths = [str(tmp_path / "a"), str(tmp_path / "a" / "inner"), str(tmp_path / "b")]
+        alone = {}
+        for path in paths:
+            scanner._du_kb_cache_clear()
+            alone[path] = _du_kb(path)
+        scanner._du_kb_cache_clear()
+        assert _du_kb_many(paths) == alone
+
+    @patch("scanner._arun")
+    def test_async_missing_paths_skip_du(self, mock_arun, tmp_path):
+        assert asyncio.run(_adu_kb_list([str(tmp_path / "missing")])) == 0
+        mock_arun.assert_not_called()
 
 
 class TestScanDiskOverview:
+    @patch("os.statvfs")
     @patch("scanner._run")
-    def test_parses_df_output(self, mock_run):
+    def test_uses_statvfs(self, mock_run, mock_statvfs):
+        mock_statvfs.return_value = os.statvfs_result(
+            (4096, 4096, 1000 * 256, 600 * 256, 500 * 256, 0, 0, 0, 0, 255)
+        )
+        result = scan_disk_overview()
+        mock_run.assert_not_called()
+        assert result["total_gb"] == pytest.approx(1000 / 1024)
+        assert result["free_gb"] == pytest.approx(500 / 1024)
+        assert result["used_pct"] == 50.0
+
+    @patch("os.statvfs", side_effect=OSError)
+    @patch("scanner._run")
+    def test_parses_df_output(self, mock_run, mock_statvfs):
         mock_run.return_value = (
-            "Filesystem  1024-blocks      Used Available Capacity iused ifree %iused Mounted on\n"
-            "/dev/disk1  976562500 488281250 488281250    50% 1000 999000  0%   /\n"
+            b"Filesystem  1024-blocks      Used Available Capacity iused ifree %iused Mounted on\n"
+            b"/dev/disk1  976562500 488281250 488281250    50% 1000 999000  0%   /\n"
         )
         result = scan_disk_overview()
         assert result["total_gb"] == pytest.approx(976562500 / (1024 * 1024), rel=0.01)
         assert result["used_pct"] == pytest.approx(50.0, abs=0.1)
 
+    @patch("os.statvfs", side_effect=OSError)
     @patch("scanner._run")
-    def test_handles_failure(self, mock_run):
+    def test_handles_failure(self, mock_run, mock_statvfs):
         mock_run.return_value = None
         result = scan_disk_overview()
         assert result["total_gb"] == 0
 
 
 class TestScanDocker:
-    @patch("scanner._run")
-    def test_docker_not_installed(self, mock_run):
-        mock_run.return_value = None
+    def test_docker_not_installed(self, monkeypatch):
+        monkeypatch.setattr(scanner, "_DOCKER_DF_CMD", ["nonexistent_command_xyz"])
         result = scan_docker()
         assert result["available"] is False
         assert result["total_kb"] == 0
 
-    @patch("scanner._run")
-    def test_parses_docker_output(self, mock_run):
-        mock_run.return_value = (
+    def test_parses_docker_output(self, monkeypatch):
+        lines = (
             '{"Type":"Images","TotalCount":"5","Active":"2","Size":"2.5GB","Reclaimable":"1.2GB (48%)"}\n'
             '{"Type":"Containers","TotalCount":"3","Active":"1","Size":"500MB","Reclaimable":"200MB (40%)"}\n'
         )
+        monkeypatch.setattr(scanner, "_DOCKER_DF_CMD", ["printf", "%s", lines])
         result = scan_docker()
         assert result["available"] is True
         assert result["total_kb"] > 0
         assert "Images" in result["details"]
         assert "Containers" in result["details"]
 
+    def test_stdlib_json_fallback(self, monkeypatch):
+        import json
+
+        monkeypatch.setattr(scanner, "_json_loads", json.loads)
+        lines = [b'{"Type":"Images","Size":"1MB","Reclaimable":"0B"}', b"{bad"]
+        result = scanner._parse_docker_df(lines)
+        assert result["details"] == {"Images": {"size_kb": 1024, "reclaimable_kb": 0}}
+
+    def test_hung_docker_is_killed(self, monkeypatch):
+        monkeypatch.setattr(scanner, "_DOCKER_DF_CMD", ["sleep", "10"])
+        monkeypatch.setattr(scanner, "_DOCKER_TIMEOUT", 0.2)
+        assert scan_docker()["available"] is False
+
+
+class TestWalk:
+    def test_respects_max_depth(self, tmp_path):
+        (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+        names = {entry.name for entry, _ in _walk(str(tmp_path), 2)}
+        assert names == {"a", "b"}
+
+    def test_prunes_named_dirs(self, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        names = {
+            entry.name
+            for entry, _ in _walk(str(tmp_path), 6, prune=frozenset({"node_modules"}))
+        }
+        assert names == {"node_modules"}
+
+    def test_does_not_follow_symlinks(self, tmp_path):
+        (tmp_path / "real" / "inner").mkdir(parents=True)
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        paths = [entry.path for entry, _ in _walk(str(tmp_path), 6)]
+        assert not any(p.startswith(str(tmp_path / "link") + os.sep) for p in paths)
+
+    def test_missing_root(self):
+        assert list(_walk("/nonexistent/path/xyz", 6)) == []
+
+    def test_skips_cloud_storage(self, tmp_path):
+        (tmp_path / "CloudStorage" / "iCloud").mkdir(parents=True)
+        names = {entry.name for entry, _ in _walk(str(tmp_path), 6)}
+        assert names == {"CloudStorage"}
+
+    def test_does_not_cross_mount_points(self, tmp_path):
+        (tmp_path / "mnt" / "inner").mkdir(parents=True)
+        # Pretend the root sits on a different device than its children
+        with patch("os.stat", return_value=MagicMock(st_dev=-1)):
+            names = {entry.name for entry, _ in _walk(str(tmp_path), 6)}
+        assert names == {"mnt"}
+
+    def test_uses_bulk_listing_when_enabled(self, tmp_path):
+        from _macos_fast import BulkEntry, VDIR
+
+        fake = {str(tmp_path): [BulkEntry("sub", str(tmp_path / "sub"), VDIR, 0, 0)]}
+        with patch("scanner._bulk_list_dir", side_effect=lambda p: fake.get(p, [])):
+            assert [e.name for e, _ in _walk(str(tmp_path), 6)] == ["sub"]
+
+
+class TestFindAllTargets:
+    def test_buckets_targets_in_one_walk(self, tmp_path):
+        (tmp_path / "app" / "node_modules" / "dep" / "node_modules").mkdir(parents=True)
+        (tmp_path / "app" / ".venv").mkdir()
+        (tmp_path / "app" / ".venv" / "pyvenv.cfg").write_text("home = /usr/bin\n")
+        model = tmp_path / "models" / "weights.pt"
+        model.parent.mkdir()
+        model.write_bytes(b"")
+        os.truncate(model, 101 * 1024 * 1024)
+        (tmp_path / "models" / "small.pt").write_bytes(b"x")
+        with patch("scanner._walk", wraps=scanner._walk) as walk:
+            targets = _find_all_targets(str(tmp_path))
+        assert walk.call_count == 1
+        assert targets == {
+            "node_modules": [str(tmp_path / "app" / "node_modules")],
+            "python_venv": [str(tmp_path / "app" / ".venv")],
+            "ml_models": [{"path": str(model), "size_kb": 101 * 1024, "ext": ".pt"}],
+        }
+
+    def test_prunes_uninteresting_dirs(self, tmp_path):
+        for skipped in (".git", "__pycache__", "Library/Caches"):
+            venv = tmp_path / skipped / "venv"
+            venv.mkdir(parents=True)
+            (venv / "pyvenv.cfg").write_text("")
+        (tmp_path / "proj" / ".venv").mkdir(parents=True)
+        (tmp_path / "proj" / ".venv" / "pyvenv.cfg").write_text("")
+        targets = _find_all_targets(str(tmp_path))
+        assert targets["python_venv"] == [str(tmp_path / "proj" / ".venv")]
+
+    def test_depth_limits(self, tmp_path):
+        deep = tmp_path.joinpath(*"abcdef")
+        (deep / "node_modules").mkdir(parents=True)
+        (deep / "venv").mkdir()
+        (deep / "venv" / "pyvenv.cfg").write_text("")
+        targets = _find_all_targets(str(tmp_path))
+        assert targets["node_modules"] == []
+        assert targets["python_venv"] == [str(deep / "venv")]
+
 
 class TestScanNodeModules:
-    @patch("scanner._du_kb")
-    @patch("scanner._run")
-    def test_finds_modules(self, mock_run, mock_du):
-        mock_run.return_value = "/project1/node_modules\n/project2/node_modules\n"
-        mock_du.side_effect = [500000, 300000]
-        result = scan_node_modules("/fake/base")
+    @patch("scanner._du_kb_many")
+    def test_finds_modules(self, mock_du, tmp_path):
+        (tmp_path / "project1" / "node_modules").mkdir(parents=True)
+        (tmp_path / "project2" / "node_modules").mkdir(parents=True)
+        mock_du.side_effect = lambda paths: dict(zip(paths, [500000, 300000]))
+        result = scan_node_modules(str(tmp_path))
         assert len(result) == 2
         assert result[0]["size_kb"] >= result[1]["size_kb"]
 
-    @patch("scanner._run")
-    def test_no_modules_found(self, mock_run):
-        mock_run.return_value = ""
-        result = scan_node_modules("/fake/base")
+    @patch("scanner._du_kb_many")
+    def test_skips_nested_modules(self, mock_du, tmp_path):
+        (tmp_path / "project1" / "node_modules" / "dep" / "node_modules").mkdir(parents=True)
+        mock_du.side_effect = lambda paths: dict.fromkeys(paths, 100)
+        result = scan_node_modules(str(tmp_path))
+        assert [r["path"] for r in result] == [str(tmp_path / "project1" / "node_modules")]
+
+    def test_no_modules_found(self, tmp_path):
+        result = scan_node_modules(str(tmp_path))
         assert result == []
 
+    @patch("scanner._walk")
+    @patch("scanner._du_kb_many", side_effect=lambda paths: dict(zip(paths, [1, 2])))
+    def test_uses_given_paths(self, mock_du, mock_walk):
+        result = scan_node_modules("/fake/base", found=["/a/node_modules", "/b/node_modules"])
+        assert [r["path"] for r in result] == ["/b/node_modules", "/a/node_modules"]
+        mock_walk.assert_not_called()
+
 
 class TestScanPythonVenvs:
-    @patch("scanner._du_kb")
-    @patch("scanner._run")
-    def test_finds_venvs(self, mock_run, mock_du):
-        mock_run.return_value = "/project1/.venv/pyvenv.cfg\n/project2/venv/pyvenv.cfg\n"
-        mock_du.side_effect = [200000, 150000]
-        result = scan_python_venvs("/fake/base")
+    @patch("scanner._du_kb_many")
+    def test_finds_venvs(self, mock_du, tmp_path):
+        for venv in ("project1/.venv", "project2/venv"):
+            (tmp_path / venv).mkdir(parents=True)
+            (tmp_path / venv / "pyvenv.cfg").write_text("home = /usr/bin\n")
+        mock_du.side_effect = lambda paths: dict(zip(paths, [200000, 150000]))
+        result = scan_python_venvs(str(tmp_path))
         assert len(result) == 2
 
-    @patch("scanner._run")
-    def test_deduplicates(self, mock_run):
-        mock_run.return_value = ""
-        result = scan_python_venvs("/fake/base")
+    def test_deduplicates(self, tmp_path):
+        result = scan_python_venvs(str(tmp_path))
         assert result == []
 
+    @patch("scanner._du_kb_many", side_effect=lambda paths: dict.fromkeys(paths, 1))
+    def test_duplicate_found_dirs_sized_once(self, mock_du):
+        result = scan_python_venvs("/fake/base", found=["/a/.venv", "/b/venv", "/a/.venv"])
+        assert mock_du.call_args[0][0] == ["/a/.venv", "/b/venv"]
+        assert [r["path"] for r in result] == ["/a/.venv", "/b/venv"]
+
 
 class TestScanMlModels:
-    @patch("scanner._run")
-    def test_no_models(self, mock_run):
-        mock_run.return_value = None
-        result = scan_ml_models("/fake/base")
+    def test_no_models(self, tmp_path):
+        (tmp_path / "small.pt").write_bytes(b"x")
+        result = scan_ml_models(str(tmp_path))
         assert result == []
 
+    @patch("scanner._run")
+    def test_finds_large_models_without_subprocess(self, mock_run, tmp_path):
+        model = tmp_path / "weights.SafeTensors"
+        model.write_bytes(b"")
+        os.truncate(model, 200 * 1024 * 1024)
+        result = scan_ml_models(str(tmp_path))
+        mock_run.assert_not_called()
+        assert result == [{"path": str(model), "size_kb": 200 * 1024, "ext": ".safetensors"}]
+
+    @patch("scanner._walk")
+    def test_sorts_found_models(self, mock_walk):
+        found = [
+            {"path": "/m/a.pt", "size_kb": 1, "ext": ".pt"},
+            {"path": "/m/b.bin", "size_kb": 2, "ext": ".bin"},
+        ]
+        assert scan_ml_models("/fake/base", found=found) == found[::-1]
+        mock_walk.assert_not_called()
+
 
 class TestScanTopProjects:
+    @pytest.fixture(autouse=True)
+    def _du_only(self, monkeypatch):
+        # Size with du on every platform unless a test opts into bulk sizing
+        monkeypatch.setattr(scanner, "_tree_alloc_kb", None)
+
     def test_nonexistent_dir(self):
         result = scan_top_projects("/nonexistent/dir/xyz")
         assert result == []
 
-    @patch("scanner._du_kb")
-    @patch("os.listdir")
-    @patch("os.path.isdir")
-    @patch("os.path.exists")
-    def test_returns_sorted(self, mock_exists, mock_isdir, mock_listdir, mock_du):
-        mock_exists.return_value = True
-        mock_isdir.return_value = True
-        mock_listdir.return_value = ["proj_a", "proj_b", "proj_c"]
-        mock_du.side_effect = [100, 300, 200]
-        result = scan_top_projects("/fake/projects", top_n=2)
-        assert len(result) == 2
-        assert result[0]["size_kb"] >= result[1]["size_kb"]
+    @patch("scanner._run")
+    def test_returns_sorted(self, mock_run, tmp_path):
+        for name in ("proj_a", "proj_b", "proj_c"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "notes.txt").write_text("")
+        mock_run.return_value = (
+            f"100\t{tmp_path / 'proj_a'}\n"
+            f"300\t{tmp_path / 'proj_b'}\n"
+            f"200\t{tmp_path / 'proj_c'}\n"
+        ).encode()
+        result = scan_top_projects(str(tmp_path), top_n=2)
+        assert [r["name"] for r in result] == ["proj_b", "proj_c"]
+
+    @patch("scanner._run")
+    def test_uses_bulk_sizes_when_available(self, mock_run, tmp_path, monkeypatch):
+        for name in ("proj_a", "proj_b"):
+            (tmp_path / name).mkdir()
+        fake = {str(tmp_path / "proj_a"): 7}
+        monkeypatch.setattr(scanner, "_tree_alloc_kb", fake.get)
+        mock_run.return_value = f"3\t{tmp_path / 'proj_b'}\n".encode()
+        result = scan_top_projects(str(tmp_path))
+        assert {r["name"]: r["size_kb"] for r in result} == {"proj_a": 7, "proj_b": 3}
+        assert mock_run.call_args[0][0][2:] == [str(tmp_path / "proj_b")]
+
+    def test_skips_symlinked_dirs(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        assert [r["name"] for r in scan_top_projects(str(tmp_path))] == ["real"]
+
+    @patch("scanner._run")
+    def test_single_du_for_all_projects(self, mock_run, tmp_path):
+        for name in ("proj_a", "proj_b"):
+            (tmp_path / name).mkdir()
+        mock_run.return_value = f"5\t{tmp_path / 'proj_a'}\n".encode()
+        result = scan_top_projects(str(tmp_path))
+        assert mock_run.call_count == 1
+        assert {r["name"]: r["size_kb"] for r in result} == {"proj_a": 5, "proj_b": 0}
 
 
 class TestRunScan:
@@ -217,7 +538,7 @@ class TestRunScan:
     @patch("scanner.scan_node_modules")
     @patch("scanner.scan_docker")
     @patch("scanner.scan_disk_overview")
-    @patch("scanner._du_kb")
+    @patch("scanner._du_kb_many")
     def test_returns_all_categories(
         self, mock_du, mock_disk, mock_docker, mock_node, mock_venv, mock_ml, mock_proj
     ):
@@ -227,7 +548,7 @@ class TestRunScan:
         mock_venv.return_value = []
         mock_ml.return_value = []
         mock_proj.return_value = []
-        mock_du.return_value = 0
+        mock_du.side_effect = lambda paths: dict.fromkeys(paths, 0)
 
         result = run_scan("/fake/home")
         assert "disk" in result
@@ -239,3 +560,161 @@ class TestRunScan:
         assert "trash" in result
         assert "downloads" in result
         assert "projects" in result
+
+    @patch("scanner.scan_top_projects")
+    @patch("scanner.scan_ml_models", return_value=[])
+    @patch("scanner.scan_python_venvs", return_value=[])
+    @patch("scanner.scan_node_modules", return_value=[])
+    @patch("scanner.scan_docker")
+    @patch("scanner.scan_disk_overview", return_value={})
+    @patch("scanner._du_kb_many")
+    def test_category_sizes_match_paths(
+        self, mock_du, mock_disk, mock_docker, mock_node, mock_venv, mock_ml, mock_proj
+    ):
+        mock_docker.return_value = {"available": False, "total_kb": 0, "reclaimable_kb": 0, "details": {}}
+        mock_proj.return_value = [{"path": "/p/a", "name": "a", "size_kb": 7}]
+        sizes = {
+            os.path.join(scanner.HOME, "Library", "Caches"): 10,
+            os.path.join(scanner.HOME, ".npm"): 20,
+            os.path.join(scanner.HOME, "Library", "Logs"): 30,
+            os.path.join(scanner.HOME, ".Trash"): 40,
+        }
+        mock_du.side_effect = lambda paths: {p: sizes.get(p, 0) for p in paths}
+
+        result = run_scan("/fake/home")
+        assert result["caches"]["total_kb"] == 30
+        assert result["caches"]["breakdown"]["npm"]["size_kb"] == 20
+        assert result["logs"]["total_kb"] == 30
+        assert result["trash"]["total_kb"] == 40
+        assert result["downloads"]["total_kb"] == 0
+        assert result["projects"]["total_kb"] == 7
+
+    @patch("scanner.scan_top_projects", return_value=[])
+    @patch("scanner.scan_docker", return_value={})
+    @patch("scanner.scan_disk_overview", return_value={})
+    @patch("scanner._du_kb_many", side_effect=lambda paths: dict.fromkeys(paths, 0))
+    @patch("scanner._find_all_targets")
+    def test_tree_scanners_get_walk_results(
+        self, mock_targets, mock_du, mock_disk, mock_docker, mock_proj, tmp_path
+    ):
+        mock_targets.return_value = {
+            "node_modules": ["/n/node_modules"],
+            "python_venv": ["/v/.venv"],
+            "ml_models": [],
+        }
+        result = run_scan(str(tmp_path))
+        mock_targets.assert_called_once_with(str(tmp_path))
+        assert result["node_modules"]["items"] == [{"path": "/n/node_modules", "size_kb": 0}]
+        assert result["python_venv"]["items"] == [{"path": "/v/.venv", "size_kb": 0}]
+        assert result["ml_models"] == {"items": [], "total_kb": 0}
+
+    @patch("scanner.scan_top_projects", return_value=[])
+    @patch("scanner.scan_docker", return_value={})
+    @patch("scanner.scan_disk_overview", return_value={})
+    @patch("scanner._du_kb_many", side_effect=lambda paths: dict.fromkeys(paths, 0))
+    @patch("scanner._find_all_targets")
+    def test_missing_base_skips_tree_scan(self, mock_targets, *_):
+        result = run_scan("/nonexistent/base/xyz")
+        mock_targets.assert_not_called()
+        for key in ("node_modules", "python_venv", "ml_models"):
+            assert result[key] == {"items": [], "total_kb": 0}
+
+
+class TestRunScanAsync:
+    @patch("os.path.exists", return_value=True)
+    @patch("scanner.scan_top_projects", return_value=[])
+    @patch("scanner._find_all_targets")
+    @patch("scanner._du_kb_many", side_effect=lambda paths: dict.fromkeys(paths, 3))
+    @patch("scanner._arun")
+    def test_matches_run_scan_shape(
+        self, mock_arun, mock_du, mock_targets, mock_proj, mock_exists, tmp_path
+    ):
+        mock_targets.return_value = {
+            "node_modules": ["/n/node_modules"],
+            "python_venv": [],
+            "ml_models": [],
+        }
+        trash = os.path.join(scanner.HOME, ".Trash")
+
+        async def fake_arun(cmd, timeout=30):
+            if cmd[0] == "du":
+                return "".join(f"40\t{p}\n" for p in cmd[2:] if p == trash).encode()
+            return None
+
+        mock_arun.side_effect = fake_arun
+        result = asyncio.run(run_scan_async(str(tmp_path)))
+        assert result["node_modules"] == {
+            "items": [{"path": "/n/node_modules", "size_kb": 3}],
+            "total_kb": 3,
+        }
+        assert result["trash"]["total_kb"] == 40
+        assert result["caches"]["total_kb"] == 0
+        assert result["docker"]["available"] is False
+        assert set(result["disk"]) == {"total_gb", "used_gb", "free_gb", "used_pct"}
+
+    @patch("scanner.scan_top_projects", return_value=[])
+    @patch("scanner._find_all_targets")
+    @patch("scanner._arun", return_value=None)
+    def test_missing_base_skips_tree_scan(self, mock_arun, mock_targets, mock_proj):
+        result = asyncio.run(run_scan_async("/nonexistent/base/xyz"))
+        mock_targets.assert_not_called()
+        assert result["ml_models"] == {"items": [], "total_kb": 0}
+
+
+class TestRunScanCached:
+    @pytest.fixture
+    def base(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scanner, "_SCAN_CACHE_DIR", str(tmp_path / "cache"))
+        base = tmp_path / "home"
+        base.mkdir()
+        return base
+
+    @patch("scanner.run_scan")
+    def test_second_call_uses_cache(self, mock_scan, base):
+        mock_scan.return_value = {"base_path": str(base), "trash": {"total_kb": 5}}
+        first = run_scan_cached(str(base))
+        second = run_scan_cached(str(base))
+        assert first == second
+        assert mock_scan.call_count == 1
+
+    @patch("scanner.run_scan")
+    def test_cache_dir_inside_hashed_root(self, mock_scan, base, monkeypatch):
+        # Like the real ~/Library/Caches/mac-storage-analyzer
+        monkeypatch.setattr(scanner, "_SCAN_CACHE_DIR", str(base / "mac-storage-analyzer"))
+        mock_scan.return_value = {"base_path": str(base)}
+        run_scan_cached(str(base))
+        run_scan_cached(str(base))
+        assert mock_scan.call_count == 1
+
+    @patch("scanner.run_scan")
+    def test_changed_root_rescans(self, mock_scan, base):
+        mock_scan.return_value = {"base_path": str(base)}
+        run_scan_cached(str(base))
+        os.utime(base, ns=(0, 12345))
+        run_scan_cached(str(base))
+        assert mock_scan.call_count == 2
+
+    @patch("scanner.run_scan")
+    def test_zero_max_age_disables_cache(self, mock_scan, base):
+        mock_scan.return_value = {"base_path": str(base)}
+        run_scan_cached(str(base), max_age=0)
+        run_scan_cached(str(base), max_age=0)
+        assert mock_scan.call_count == 2
+
+
+class TestSummarizeCategories:
+    def test_reads_sizes_and_items(self):
+        items = [{"path": "/a/node_modules", "size_kb": 5}]
+        summaries = summarize_categories({
+            "docker": {"available": True, "total_kb": 10, "reclaimable_kb": 4},
+            "node_modules": {"items": items, "total_kb": 5},
+        })
+        assert summaries["docker"].reclaimable_kb == 4
+        assert summaries["node_modules"].items == items
+        assert summaries["node_modules"].total_kb == 5
+
+    def test_missing_categories_unavailable(self):
+        summaries = summarize_categories({"docker": {"available": False, "total_kb": 0}})
+        assert summaries["docker"].available is False
+        assert summaries["trash"].available is False
+        assert summaries["trash"].total_kb == 0